@@ -1,4 +1,5 @@
 import { describe, test, expect, mock, beforeEach } from 'bun:test'
+import { gunzipSync } from 'node:zlib'
 
 // ---------------------------------------------------------------------------
 // Direct imports for pure utility functions (no mocking needed)
@@ -6,10 +7,13 @@ import { describe, test, expect, mock, beforeEach } from 'bun:test'
 
 import {
   humanBytes,
+  percentOf,
   formatAge,
   sanitizeName,
   generateUid,
   repoToName,
+  vscodeUrl,
+  acceptsEncoding,
 } from '../app/lib/utils'
 
 // ---------------------------------------------------------------------------
@@ -37,9 +41,22 @@ mock.module('@workspacekit/k8s', () => ({
 }))
 
 // Import stats and logs after mocking
-const { getStats, getUsageHistory } = await import('../app/server/stats')
-const { appendCreationLog, getCreationLog, clearCreationLog, hasCreationLog } =
-  await import('../app/server/logs')
+const {
+  getStats,
+  getStatsEtag,
+  getStatsJson,
+  getStatsGzip,
+  getUsageHistory,
+  downsampleUsage,
+  _publishStats,
+} = await import('../app/server/stats')
+const {
+  appendCreationLog,
+  getCreationLog,
+  getCreationLogSince,
+  clearCreationLog,
+  hasCreationLog,
+} = await import('../app/server/logs')
 
 // ---------------------------------------------------------------------------
 // Utility function tests
@@ -77,6 +94,19 @@ describe('humanBytes', () => {
   })
 })
 
+describe('percentOf', () => {
+  test('rounds to a whole percentage', () => {
+    expect(percentOf(1, 3)).toBe(33)
+    expect(percentOf(2, 3)).toBe(67)
+    expect(percentOf(50, 50)).toBe(100)
+  })
+
+  test('returns 0 when the total is unknown', () => {
+    expect(percentOf(10, 0)).toBe(0)
+    expect(percentOf(0, 0)).toBe(0)
+  })
+})
+
 describe('formatAge', () => {
   test('formats timestamps less than an hour old as minutes', () => {
     const thirtyMinAgo = new Date(Date.now() - 30 * 60 * 1000).toISOString()
@@ -207,6 +237,43 @@ describe('repoToName', () => {
   })
 })
 
+describe('vscodeUrl', () => {
+  test('builds the workspace URL', () => {
+    expect(vscodeUrl('10.0.0.5', 30100, 'abc123', 'my-repo')).toBe(
+      'http://10.0.0.5:30100/?tkn=abc123&folder=/workspace/my-repo',
+    )
+  })
+
+  test('encodes query characters in the token and name', () => {
+    expect(vscodeUrl('h', 1, 'a&b', 'x y#z')).toBe(
+      'http://h:1/?tkn=a%26b&folder=/workspace/x%20y%23z',
+    )
+  })
+})
+
+describe('acceptsEncoding', () => {
+  test('accepts a listed coding', () => {
+    expect(acceptsEncoding('gzip, deflate, br', 'gzip')).toBe(true)
+    expect(acceptsEncoding('br;q=1.0, gzip;q=0.8', 'gzip')).toBe(true)
+  })
+
+  test('refuses an explicit q=0', () => {
+    expect(acceptsEncoding('gzip;q=0', 'gzip')).toBe(false)
+    expect(acceptsEncoding('*, gzip; q=0', 'gzip')).toBe(false)
+  })
+
+  test('falls back to the wildcard', () => {
+    expect(acceptsEncoding('*', 'gzip')).toBe(true)
+    expect(acceptsEncoding('*;q=0', 'gzip')).toBe(false)
+  })
+
+  test('refuses missing or unrelated headers', () => {
+    expect(acceptsEncoding(null, 'gzip')).toBe(false)
+    expect(acceptsEncoding('deflate, br', 'gzip')).toBe(false)
+    expect(acceptsEncoding('xgzip', 'gzip')).toBe(false)
+  })
+})
+
 // ---------------------------------------------------------------------------
 // Stats module tests
 // ---------------------------------------------------------------------------
@@ -244,6 +311,20 @@ describe('getStats', () => {
     expect(typeof stats.load[1]).toBe('number')
     expect(typeof stats.load[2]).toBe('number')
   })
+
+  test('gzipped snapshot decodes to the JSON snapshot', () => {
+    expect(gunzipSync(getStatsGzip()).toString()).toBe(getStatsJson())
+    expect(getStatsGzip()).toBe(getStatsGzip())
+  })
+
+  test('publishing identical content keeps the ETag', () => {
+    const etag = getStatsEtag()
+    _publishStats(structuredClone(getStats()))
+    expect(getStatsEtag()).toBe(etag)
+
+    _publishStats({ ...structuredClone(getStats()), tasks: 'changed' })
+    expect(getStatsEtag()).not.toBe(etag)
+  })
 })
 
 describe('getUsageHistory', () => {
@@ -258,6 +339,26 @@ describe('getUsageHistory', () => {
   })
 })
 
+describe('downsampleUsage', () => {
+  const entries = Array.from({ length: 10 }, (_, i) => ({
+    timestamp: i,
+    cpu_mc: i === 3 ? 900 : 100,
+    mem_bytes: i * 10,
+  }))
+
+  test('returns the input unchanged when it already fits', () => {
+    expect(downsampleUsage(entries, 10)).toBe(entries)
+    expect(downsampleUsage(entries, 20)).toBe(entries)
+  })
+
+  test('keeps the last timestamp and peak values per bucket', () => {
+    const out = downsampleUsage(entries, 5)
+    expect(out).toHaveLength(5)
+    expect(out[1]).toEqual({ timestamp: 3, cpu_mc: 900, mem_bytes: 30 })
+    expect(out[4]).toEqual({ timestamp: 9, cpu_mc: 100, mem_bytes: 90 })
+  })
+})
+
 // ---------------------------------------------------------------------------
 // Logs module tests
 // ---------------------------------------------------------------------------
@@ -371,3 +472,40 @@ describe('creation log max line limit', () => {
     expect(lines[499]).toBe('Line 499')
   })
 })
+
+describe('getCreationLogSince', () => {
+  beforeEach(() => {
+    clearCreationLog('test-ws')
+    clearCreationLog('overflow-ws')
+  })
+
+  test('returns only lines appended after the cursor', () => {
+    appendCreationLog('test-ws', 'Line 1')
+    appendCreationLog('test-ws', 'Line 2')
+    const first = getCreationLogSince('test-ws', 0)
+    expect(first.lines).toEqual(['Line 1', 'Line 2'])
+
+    appendCreationLog('test-ws', 'Line 3')
+    const second = getCreationLogSince('test-ws', first.cursor)
+    expect(second.lines).toEqual(['Line 3'])
+    expect(getCreationLogSince('test-ws', second.cursor).lines).toEqual([])
+  })
+
+  test('keeps advancing once the buffer is full', () => {
+    for (let i = 0; i < 500; i++) {
+      appendCreationLog('overflow-ws', `Line ${i}`)
+    }
+    const { cursor } = getCreationLogSince('overflow-ws', 0)
+
+    appendCreationLog('overflow-ws', 'Line 500')
+    appendCreationLog('overflow-ws', 'Line 501')
+    expect(getCreationLogSince('overflow-ws', cursor).lines).toEqual([
+      'Line 500',
+      'Line 501',
+    ])
+  })
+
+  test('returns nothing for a workspace with no logs', () => {
+    expect(getCreationLogSince('nonexistent-ws', 0).lines).toEqual([])
+  })
+})
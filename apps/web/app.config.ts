@@ -8,9 +8,30 @@ const __dirname = path.dirname(fileURLToPath(import.meta.url))
 export default defineConfig({
   server: {
     preset: 'bun',
+    // Write .gz / .br siblings for every public asset at build time; the
+    // static handler picks one per Accept-Encoding and sets Vary.
+    compressPublicAssets: { gzip: true, brotli: true },
+    routeRules: {
+      // Client bundles are content-hashed by the build, so a URL never
+      // changes meaning. Nitro's static handler still answers revalidations
+      // with ETag / Last-Modified 304s.
+      '/_build/assets/**': {
+        headers: { 'Cache-Control': 'public, max-age=31536000, immutable' },
+      },
+    },
   },
   vite: {
     plugins: [tailwindcss()],
+    build: {
+      // Tailwind already depends on Lightning CSS; using it for the final
+      // pass too merges duplicate rules and shortens colours and numbers,
+      // which esbuild's whitespace-level CSS minifier does not.
+      cssMinify: 'lightningcss',
+      // Tailwind v4 itself requires these browsers. Targeting Vite's older
+      // defaults only makes the minifier add vendor prefixes and fallbacks
+      // that no supported browser reads.
+      cssTarget: ['chrome111', 'edge111', 'firefox128', 'safari16.4'],
+    },
     resolve: {
       alias: {
         '~': path.resolve(__dirname, 'app'),
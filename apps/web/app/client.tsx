@@ -1,4 +1,3 @@
-import './globals.css'
 import { StartClient } from '@tanstack/react-start'
 import { hydrateRoot } from 'react-dom/client'
 import { createRouter } from './router'
@@ -1,4 +1,4 @@
-import { useRef, useEffect, useMemo } from 'react'
+import { useRef, useEffect, useMemo, memo } from 'react'
 
 // ---------------------------------------------------------------------------
 // Gauge — circular SVG arc showing percentage
@@ -10,14 +10,28 @@ interface GaugeProps {
   size?: number
 }
 
+const GAUGE_OK = 'var(--color-success)'
+const GAUGE_WARN = 'var(--color-warning)'
+const GAUGE_CRIT = 'var(--color-destructive)'
+
+/**
+ * Arc colour per decile (index = floor(value / 10)): warning from 70%,
+ * destructive from 90%.
+ */
+const GAUGE_COLORS = [
+  GAUGE_OK, GAUGE_OK, GAUGE_OK, GAUGE_OK, GAUGE_OK, GAUGE_OK, GAUGE_OK,
+  GAUGE_WARN, GAUGE_WARN,
+  GAUGE_CRIT, GAUGE_CRIT,
+] as const
+
+/** `value` must already be clamped to 0-100 (and not NaN). */
 function gaugeColor(value: number): string {
-  if (value >= 90) return 'var(--color-destructive)'
-  if (value >= 70) return 'var(--color-warning)'
-  return 'var(--color-success)'
+  return GAUGE_COLORS[Math.floor(value / 10)]
 }
 
 export function Gauge({ value, label, size = 96 }: GaugeProps) {
-  const clamped = Math.max(0, Math.min(100, value))
+  // `|| 0` maps NaN (e.g. a 0/0 percentage) to an empty gauge.
+  const clamped = Math.min(100, Math.max(0, value || 0))
   const strokeWidth = 8
   const radius = (size - strokeWidth) / 2
   const circumference = 2 * Math.PI * radius
@@ -47,7 +61,7 @@ export function Gauge({ value, label, size = 96 }: GaugeProps) {
           strokeDasharray={circumference}
           strokeDashoffset={offset}
           strokeLinecap="round"
-          className="transition-all duration-500"
+          className="transition-[stroke-dashoffset,stroke] duration-500"
         />
       </svg>
       <div
@@ -76,35 +90,35 @@ interface SparklineProps {
   color?: string
 }
 
-export function Sparkline({
+/**
+ * Memoized so a parent re-render only touches the SVG when `data` (by
+ * identity) or the dimensions change; callers should keep `data` stable.
+ */
+export const Sparkline = memo(function Sparkline({
   data,
   width = 200,
   height = 40,
   color = 'var(--color-primary)',
 }: SparklineProps) {
-  const points = useMemo(() => {
-    if (data.length === 0) return ''
-    const max = Math.max(...data, 1)
-    const step = width / Math.max(data.length - 1, 1)
-    return data
-      .map((v, i) => {
-        const x = i * step
-        const y = height - (v / max) * (height - 4) - 2
-        return `${x},${y}`
-      })
-      .join(' ')
-  }, [data, width, height])
-
-  const areaPath = useMemo(() => {
-    if (data.length === 0) return ''
-    const max = Math.max(...data, 1)
-    const step = width / Math.max(data.length - 1, 1)
-    const pts = data.map((v, i) => {
-      const x = i * step
-      const y = height - (v / max) * (height - 4) - 2
-      return `${x},${y}`
-    })
-    return `M0,${height} L${pts.join(' L')} L${width},${height} Z`
+  // One pass: find the max without spreading into Math.max (which throws on
+  // very long arrays), then emit integer coordinates shared by both shapes.
+  const { points, areaPath } = useMemo(() => {
+    const n = data.length
+    if (n === 0) return { points: '', areaPath: '' }
+    let max = 1
+    for (let i = 0; i < n; i++) {
+      if (data[i] > max) max = data[i]
+    }
+    const step = width / Math.max(n - 1, 1)
+    const scale = (height - 4) / max
+    const coords = new Array<string>(n)
+    for (let i = 0; i < n; i++) {
+      coords[i] = `${Math.round(i * step)},${Math.round(height - data[i] * scale - 2)}`
+    }
+    return {
+      points: coords.join(' '),
+      areaPath: `M0,${height} L${coords.join(' L')} L${width},${height} Z`,
+    }
   }, [data, width, height])
 
   if (data.length < 2) {
@@ -137,4 +151,4 @@ export function Sparkline({
       />
     </svg>
   )
-}
+})
@@ -51,8 +51,13 @@ export function CreationProgress({ uid, onComplete }: CreationProgressProps) {
   const [done, setDone] = useState(false)
   const logRef = useRef<HTMLDivElement>(null)
   const eventSourceRef = useRef<EventSource | null>(null)
+  // Read through a ref so a new inline callback from the parent does not
+  // tear down and reopen the stream.
+  const onCompleteRef = useRef(onComplete)
+  onCompleteRef.current = onComplete
 
   useEffect(() => {
+    let completeTimer: ReturnType<typeof setTimeout> | null = null
     const es = new EventSource(`/api/logs/creation-stream/${encodeURIComponent(uid)}`)
     eventSourceRef.current = es
 
@@ -84,9 +89,9 @@ export function CreationProgress({ uid, onComplete }: CreationProgressProps) {
         const data = JSON.parse(e.data) as { status: string }
         setDone(true)
         es.close()
-        if (data.status === 'completed' && onComplete) {
+        if (data.status === 'completed' && completeTimer === null) {
           // Short delay so user can see the final state
-          setTimeout(onComplete, 1500)
+          completeTimer = setTimeout(() => onCompleteRef.current?.(), 1500)
         }
       } catch {
         // ignore
@@ -98,9 +103,10 @@ export function CreationProgress({ uid, onComplete }: CreationProgressProps) {
     }
 
     return () => {
+      if (completeTimer !== null) clearTimeout(completeTimer)
       es.close()
     }
-  }, [uid, onComplete])
+  }, [uid])
 
   return (
     <div className="grid gap-6 lg:grid-cols-[280px_1fr]">
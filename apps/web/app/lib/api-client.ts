@@ -0,0 +1,45 @@
+/**
+ * Browser-side helpers for calling the dashboard's /api routes.
+ * Mutating requests must carry the X-Requested-With header that
+ * requireCsrf() checks on the server; these helpers always add it.
+ */
+
+const CSRF_HEADERS = { 'X-Requested-With': 'workspacekit' } as const
+
+const JSON_POST_HEADERS = {
+  'Content-Type': 'application/json',
+  ...CSRF_HEADERS,
+} as const
+
+/**
+ * POSTs `body` as JSON to an /api route.
+ *
+ * Sent with `keepalive` so a mutation is still delivered if the page
+ * reloads or navigates away before the response arrives. Pass `signal`
+ * to cancel a request whose result is no longer wanted.
+ */
+export function apiPost(
+  path: string,
+  body: unknown,
+  signal?: AbortSignal,
+): Promise<Response> {
+  return fetch(path, {
+    method: 'POST',
+    headers: JSON_POST_HEADERS,
+    body: JSON.stringify(body),
+    keepalive: true,
+    signal,
+  })
+}
+
+/**
+ * Sends a DELETE to an /api route.
+ */
+export function apiDelete(path: string, signal?: AbortSignal): Promise<Response> {
+  return fetch(path, {
+    method: 'DELETE',
+    headers: CSRF_HEADERS,
+    keepalive: true,
+    signal,
+  })
+}
@@ -0,0 +1,90 @@
+/**
+ * Client-side polling of /api/stats shared by the dashboard pages.
+ * Each poll revalidates against the last ETag so an unchanged snapshot
+ * costs a bodyless 304 and no re-render.
+ */
+
+import { useEffect, useRef } from 'react'
+import type { SystemStats } from '@workspacekit/types'
+
+/** Matches the server-side collection interval. */
+const STATS_POLL_INTERVAL_MS = 5_000
+
+/**
+ * Calls `onStats` with each new stats snapshot. Polls that come back 304
+ * (snapshot unchanged since the previous one) or fail are skipped.
+ *
+ * Polling stops while the tab is hidden and resumes with an immediate poll
+ * when it becomes visible again, so background tabs do no work and never
+ * build up a backlog of throttled timers. While a mouse button is held
+ * (text selection, dragging) polls are skipped so a re-render does not
+ * cut the interaction short; the schedule itself keeps running. A button
+ * released outside the window never delivers its mouseup, so losing focus,
+ * a cancelled pointer or a visibility change also resumes polling.
+ */
+export function useStatsPoll(
+  onStats: (stats: SystemStats) => void,
+  intervalMs = STATS_POLL_INTERVAL_MS,
+): void {
+  const onStatsRef = useRef(onStats)
+  onStatsRef.current = onStats
+
+  useEffect(() => {
+    let etag: string | null = null
+    let timer: ReturnType<typeof setTimeout> | null = null
+    let paused = false
+    // Aborted on unmount so a poll still in flight when the user navigates
+    // away is dropped instead of being parsed and handed to a dead page.
+    const controller = new AbortController()
+
+    const poll = async () => {
+      try {
+        const res = await fetch('/api/stats', {
+          headers: etag ? { 'If-None-Match': etag } : {},
+          signal: controller.signal,
+        })
+        if (res.status === 304 || !res.ok) return
+        etag = res.headers.get('ETag')
+        const stats = (await res.json()) as SystemStats
+        if (!controller.signal.aborted) onStatsRef.current(stats)
+      } catch {
+        // ignore fetch errors and aborts
+      }
+    }
+
+    const tick = () => {
+      timer = null
+      if (document.visibilityState !== 'visible') return
+      if (!paused) void poll()
+      timer = setTimeout(tick, intervalMs)
+    }
+
+    const onVisibilityChange = () => {
+      paused = false
+      if (document.visibilityState === 'visible' && timer === null) tick()
+    }
+    const onMouseDown = () => {
+      paused = true
+    }
+    const resume = () => {
+      paused = false
+    }
+
+    timer = setTimeout(tick, intervalMs)
+    document.addEventListener('visibilitychange', onVisibilityChange)
+    document.addEventListener('mousedown', onMouseDown)
+    document.addEventListener('mouseup', resume)
+    document.addEventListener('pointercancel', resume)
+    window.addEventListener('blur', resume)
+
+    return () => {
+      controller.abort()
+      if (timer !== null) clearTimeout(timer)
+      document.removeEventListener('visibilitychange', onVisibilityChange)
+      document.removeEventListener('mousedown', onMouseDown)
+      document.removeEventListener('mouseup', resume)
+      document.removeEventListener('pointercancel', resume)
+      window.removeEventListener('blur', resume)
+    }
+  }, [intervalMs])
+}
@@ -4,16 +4,28 @@
 
 import crypto from 'node:crypto'
 
+const KIB = 1024
+const MIB = 1024 ** 2
+const GIB = 1024 ** 3
+
 /**
  * Converts raw bytes into a human-readable string (e.g. "2.5Gi", "512Mi").
  */
 export function humanBytes(b: number): string {
-  if (b >= 1024 ** 3) return `${(b / 1024 ** 3).toFixed(1)}Gi`
-  if (b >= 1024 ** 2) return `${Math.round(b / 1024 ** 2)}Mi`
-  if (b >= 1024) return `${Math.round(b / 1024)}Ki`
+  if (b >= GIB) return `${(b / GIB).toFixed(1)}Gi`
+  if (b >= MIB) return `${Math.round(b / MIB)}Mi`
+  if (b >= KIB) return `${Math.round(b / KIB)}Ki`
   return `${b}B`
 }
 
+/**
+ * Returns `used` as a whole-number percentage of `total`, or 0 when the
+ * total is unknown (e.g. stats not collected yet).
+ */
+export function percentOf(used: number, total: number): number {
+  return total > 0 ? Math.round((used / total) * 100) : 0
+}
+
 /**
  * Parses an ISO 8601 timestamp and returns a human-readable relative age
  * such as "2d 3h" or "45m".
@@ -68,3 +80,28 @@ export function repoToName(repoUrl: string): string {
     .split('/')
   return sanitizeName(parts[parts.length - 1] || '')
 }
+
+/**
+ * Builds the openvscode-server URL for a running workspace on `host`.
+ * The token and folder name are URL-encoded here once, so callers never
+ * interpolate them into the query string raw.
+ */
+export function vscodeUrl(host: string, port: number, uid: string, name: string): string {
+  return `http://${host}:${port}/?tkn=${encodeURIComponent(uid)}&folder=/workspace/${encodeURIComponent(name)}`
+}
+
+/**
+ * Whether an Accept-Encoding header value allows `coding`. An explicit entry
+ * for the coding wins over `*`, and either is refused by `q=0`.
+ */
+export function acceptsEncoding(header: string | null, coding: string): boolean {
+  let wildcard = false
+  for (const entry of (header ?? '').split(',')) {
+    const [name, ...params] = entry.split(';').map((p) => p.trim().toLowerCase())
+    const q = params.find((p) => p.startsWith('q='))
+    const allowed = q === undefined || Number(q.slice(2)) > 0
+    if (name === coding) return allowed
+    if (name === '*') wildcard = allowed
+  }
+  return wildcard
+}
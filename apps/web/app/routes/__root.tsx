@@ -10,6 +10,7 @@ import { useRouterState } from '@tanstack/react-router'
 import { Server, ChevronRight } from 'lucide-react'
 import { Navigator } from '~/components/navigator'
 import { TasksPanel } from '~/components/tasks-panel'
+import { apiDelete } from '~/lib/api-client'
 import globalsCss from '~/globals.css?url'
 
 // ---------------------------------------------------------------------------
@@ -78,6 +79,28 @@ const fetchNavWorkspaces = createServerFn({ method: 'GET' }).handler(
   },
 )
 
+// ---------------------------------------------------------------------------
+// Document head
+// ---------------------------------------------------------------------------
+
+/**
+ * The document shell is identical for every page, so build the meta and
+ * link tags once instead of on every navigation.
+ */
+const ROOT_HEAD = {
+  meta: [
+    { charSet: 'utf-8' },
+    { name: 'viewport', content: 'width=device-width, initial-scale=1' },
+    { title: 'WorkspaceKit' },
+    {
+      name: 'description',
+      content: 'Cloud development workspace management dashboard',
+    },
+  ],
+  // The only stylesheet; the client entry deliberately does not import it.
+  links: [{ rel: 'stylesheet', href: globalsCss }],
+}
+
 // ---------------------------------------------------------------------------
 // Route
 // ---------------------------------------------------------------------------
@@ -99,18 +122,7 @@ export const Route = createRootRoute({
     return { navWorkspaces }
   },
   component: RootLayout,
-  head: () => ({
-    meta: [
-      { charSet: 'utf-8' },
-      { name: 'viewport', content: 'width=device-width, initial-scale=1' },
-      { title: 'WorkspaceKit' },
-      {
-        name: 'description',
-        content: 'Cloud development workspace management dashboard',
-      },
-    ],
-    links: [{ rel: 'stylesheet', href: globalsCss }],
-  }),
+  head: () => ROOT_HEAD,
 })
 
 // ---------------------------------------------------------------------------
@@ -175,10 +187,7 @@ function RootLayout() {
     | undefined
 
   const handleLogout = async () => {
-    await fetch('/api/login', {
-      method: 'DELETE',
-      headers: { 'X-Requested-With': 'workspacekit' },
-    })
+    await apiDelete('/api/login')
     window.location.href = '/login'
   }
 
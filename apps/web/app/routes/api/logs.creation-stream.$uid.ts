@@ -1,8 +1,14 @@
 import { createAPIFileRoute } from '@tanstack/react-start/api'
 import { coreV1, namespace, getPod, isPodReady } from '@workspacekit/k8s'
-import type { CreationStepId, CreationStepStatus } from '@workspacekit/types'
+import type { CreationStep, CreationStepId, CreationStepStatus } from '@workspacekit/types'
 import { requireAuth, sanitizeError } from '~/server/auth'
-import { getCreationState, updateStep, finishCreationLog, appendCreationLog } from '~/server/logs'
+import {
+  getCreationState,
+  getCreationLogSince,
+  updateStep,
+  finishCreationLog,
+  appendCreationLog,
+} from '~/server/logs'
 
 // ---------------------------------------------------------------------------
 // Helpers
@@ -17,6 +23,9 @@ function fail(message: string, status = 400): Response {
 
 const STEP_MARKER_RE = /^@@STEP:(\w+):([\w-]+)$/
 
+/** SSE frames are encoded with one shared, stateless encoder. */
+const encoder = new TextEncoder()
+
 // ---------------------------------------------------------------------------
 // Route
 // ---------------------------------------------------------------------------
@@ -32,31 +41,43 @@ export const APIRoute = createAPIFileRoute('/api/logs/creation-stream/$uid')({
       }
 
       const podName = `ws-${uid}`
-      const encoder = new TextEncoder()
       let lastInitLogLen = 0
       let lastMainLogLen = 0
-      let lastLinesSent = 0
+      let logCursor = 0
+      let lastStepsJson = ''
 
       const stream = new ReadableStream({
         start(controller) {
+          function frame(event: string, data: unknown): string {
+            return `event: ${event}\ndata: ${JSON.stringify(data)}\n\n`
+          }
+
           function send(event: string, data: unknown) {
-            controller.enqueue(
-              encoder.encode(`event: ${event}\ndata: ${JSON.stringify(data)}\n\n`),
-            )
+            controller.enqueue(encoder.encode(frame(event, data)))
           }
 
-          // Send initial state
-          const state = getCreationState(uid)
-          if (state) {
-            send('steps', state.steps)
-            if (state.lines.length > 0) {
-              for (const line of state.lines) {
-                send('log', line)
-              }
-              lastLinesSent = state.lines.length
+          // Push everything the client has not seen as a single chunk: the
+          // steps only when they changed, then lines appended since the
+          // cursor. Nothing is written when nothing happened.
+          function flush(steps: CreationStep[]) {
+            let chunk = ''
+            const stepsJson = JSON.stringify(steps)
+            if (stepsJson !== lastStepsJson) {
+              lastStepsJson = stepsJson
+              chunk += `event: steps\ndata: ${stepsJson}\n\n`
+            }
+            const fresh = getCreationLogSince(uid, logCursor)
+            logCursor = fresh.cursor
+            for (const line of fresh.lines) {
+              chunk += frame('log', line)
             }
+            if (chunk) controller.enqueue(encoder.encode(chunk))
           }
 
+          // Send initial state
+          const state = getCreationState(uid)
+          if (state) flush(state.steps)
+
           const pollInterval = setInterval(async () => {
             try {
               const pod = await getPod(podName)
@@ -134,15 +155,7 @@ export const APIRoute = createAPIFileRoute('/api/logs/creation-stream/$uid')({
               // --- Send updated state ---
               const currentState = getCreationState(uid)
               if (currentState) {
-                send('steps', currentState.steps)
-
-                // Send new log lines
-                if (currentState.lines.length > lastLinesSent) {
-                  for (let i = lastLinesSent; i < currentState.lines.length; i++) {
-                    send('log', currentState.lines[i])
-                  }
-                  lastLinesSent = currentState.lines.length
-                }
+                flush(currentState.steps)
 
                 // Check if done
                 if (currentState.status === 'completed' || currentState.status === 'error') {
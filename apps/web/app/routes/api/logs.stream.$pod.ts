@@ -13,6 +13,9 @@ function fail(message: string, status = 400): Response {
   })
 }
 
+/** Shared by every log stream; TextEncoder keeps no per-stream state. */
+const encoder = new TextEncoder()
+
 // ---------------------------------------------------------------------------
 // Route
 // ---------------------------------------------------------------------------
@@ -42,8 +45,6 @@ export const APIRoute = createAPIFileRoute('/api/logs/stream/$pod')({
           ? logResponse
           : String(logResponse)
 
-      const encoder = new TextEncoder()
-
       const stream = new ReadableStream({
         start(controller) {
           const lines = logText.split('\n')
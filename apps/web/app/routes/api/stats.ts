@@ -1,18 +1,36 @@
 import { createAPIFileRoute } from '@tanstack/react-start/api'
 import { requireAuth, sanitizeError } from '~/server/auth'
-import { getStats } from '~/server/stats'
+import { getStatsBytes, getStatsEtag, getStatsGzip } from '~/server/stats'
+import { acceptsEncoding } from '~/lib/utils'
 
 export const APIRoute = createAPIFileRoute('/api/stats')({
   GET: async ({ request }) => {
     try {
       requireAuth(request)
-      const stats = getStats()
-      return new Response(JSON.stringify(stats), {
-        headers: {
-          'Content-Type': 'application/json',
-          'Cache-Control': 'no-store',
-        },
-      })
+      // Each content-coding is its own representation and needs its own
+      // strong validator; either form revalidates the current snapshot.
+      const identityEtag = getStatsEtag()
+      const gzipEtag = `${identityEtag.slice(0, -1)}-gz"`
+      const gzip = acceptsEncoding(request.headers.get('Accept-Encoding'), 'gzip')
+      const etag = gzip ? gzipEtag : identityEtag
+      const ifNoneMatch = request.headers.get('If-None-Match')
+      if (ifNoneMatch === identityEtag || ifNoneMatch === gzipEtag) {
+        return new Response(null, {
+          status: 304,
+          headers: { ETag: etag, 'Cache-Control': 'no-store', Vary: 'Accept-Encoding' },
+        })
+      }
+      const headers: Record<string, string> = {
+        'Content-Type': 'application/json',
+        'Cache-Control': 'no-store',
+        ETag: etag,
+        Vary: 'Accept-Encoding',
+      }
+      if (gzip) {
+        headers['Content-Encoding'] = 'gzip'
+        return new Response(getStatsGzip(), { headers })
+      }
+      return new Response(getStatsBytes(), { headers })
     } catch (err) {
       if (err instanceof Response) throw err
       const message =
@@ -74,14 +74,17 @@ export const APIRoute = createAPIFileRoute('/api/terminal/$pod')({
       const stdout = new PassThrough()
       const stderr = new PassThrough()
 
-      let stdoutData = ''
-      let stderrData = ''
+      // Collect raw chunks and decode once at the end: repeated string
+      // concatenation copies the growing buffer on every chunk, and decoding
+      // per chunk can split multi-byte UTF-8 sequences.
+      const stdoutChunks: Buffer[] = []
+      const stderrChunks: Buffer[] = []
 
       stdout.on('data', (chunk: Buffer) => {
-        stdoutData += chunk.toString('utf-8')
+        stdoutChunks.push(chunk)
       })
       stderr.on('data', (chunk: Buffer) => {
-        stderrData += chunk.toString('utf-8')
+        stderrChunks.push(chunk)
       })
 
       const ws = await exec.exec(
@@ -112,8 +115,8 @@ export const APIRoute = createAPIFileRoute('/api/terminal/$pod')({
 
       return json({
         ok: true,
-        stdout: stdoutData,
-        stderr: stderrData,
+        stdout: Buffer.concat(stdoutChunks).toString('utf-8'),
+        stderr: Buffer.concat(stderrChunks).toString('utf-8'),
       })
     } catch (err) {
       if (err instanceof Response) throw err
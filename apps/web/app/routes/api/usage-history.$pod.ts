@@ -32,7 +32,12 @@ export const APIRoute = createAPIFileRoute('/api/usage-history/$pod')({
         return fail('Missing pod parameter')
       }
 
-      const history = getUsageHistory(pod)
+      // Optional ?buckets=N caps the number of points returned.
+      const buckets = Number(new URL(request.url).searchParams.get('buckets'))
+      const history = getUsageHistory(
+        pod,
+        Number.isInteger(buckets) && buckets > 0 ? buckets : undefined,
+      )
 
       return json(history)
     } catch (err) {
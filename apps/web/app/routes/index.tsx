@@ -1,8 +1,9 @@
-import { createFileRoute } from '@tanstack/react-router'
+import { createFileRoute, Await } from '@tanstack/react-router'
 import { createServerFn } from '@tanstack/react-start'
 import { useState, useEffect, useRef } from 'react'
 import type { SystemStats } from '@workspacekit/types'
-import { humanBytes } from '~/lib/utils'
+import { humanBytes, percentOf } from '~/lib/utils'
+import { useStatsPoll } from '~/lib/stats-poll'
 import { Card, CardContent, CardHeader, CardTitle } from '~/components/ui/card'
 import { Gauge, Sparkline } from '~/components/charts'
 import { Cpu, MemoryStick, HardDrive, Server, Box } from 'lucide-react'
@@ -39,12 +40,15 @@ const fetchWorkspaceCounts = createServerFn({ method: 'GET' }).handler(
 // Route
 // ---------------------------------------------------------------------------
 
+type WorkspaceCounts = Awaited<ReturnType<typeof fetchWorkspaceCounts>>
+
 export const Route = createFileRoute('/')({
   loader: async () => {
-    const [stats, counts] = await Promise.all([
-      fetchStats(),
-      fetchWorkspaceCounts(),
-    ])
+    // Stats come from the in-memory cache and are ready immediately; the
+    // counts need pod + configmap listings. Leave that promise unawaited so
+    // the page streams out first and the counts fill in when they resolve.
+    const counts = fetchWorkspaceCounts()
+    const stats = await fetchStats()
     return { stats, counts }
   },
   component: HostSummaryPage,
@@ -79,59 +83,34 @@ function HostSummaryPage() {
   // Initialize with SSR data
   useEffect(() => {
     if (initialStats) {
-      const cpuPct = initialStats.cpu?.['_system'] ?? 0
-      const memPct =
-        initialStats.mem.total > 0
-          ? Math.round(
-              ((initialStats.mem.total - initialStats.mem.available) /
-                initialStats.mem.total) *
-                100,
-            )
-          : 0
-      cpuHistory.current = [cpuPct]
-      memHistory.current = [memPct]
+      const { total, available } = initialStats.mem
+      cpuHistory.current = [initialStats.cpu?.['_system'] ?? 0]
+      memHistory.current = [percentOf(total - available, total)]
     }
   }, [])
 
   // Poll /api/stats every 5s
-  useEffect(() => {
-    const interval = setInterval(async () => {
-      try {
-        const res = await fetch('/api/stats')
-        if (!res.ok) return
-        const data = (await res.json()) as SystemStats
-        setStats(data)
+  useStatsPoll((data) => {
+    setStats(data)
 
-        const cpuPct = data.cpu?.['_system'] ?? 0
-        const memPct =
-          data.mem.total > 0
-            ? Math.round(
-                ((data.mem.total - data.mem.available) / data.mem.total) * 100,
-              )
-            : 0
+    const cpuPct = data.cpu?.['_system'] ?? 0
+    const { total, available } = data.mem
+    const memPct = percentOf(total - available, total)
 
-        cpuHistory.current = [...cpuHistory.current.slice(-59), cpuPct]
-        memHistory.current = [...memHistory.current.slice(-59), memPct]
-        forceUpdate((n) => n + 1)
-      } catch {
-        // ignore fetch errors
-      }
-    }, 5000)
+    cpuHistory.current = [...cpuHistory.current.slice(-59), cpuPct]
+    memHistory.current = [...memHistory.current.slice(-59), memPct]
+    forceUpdate((n) => n + 1)
+  })
 
-    return () => clearInterval(interval)
-  }, [])
+  // Bind the nested stats objects once; they are read several times below.
+  const mem = stats?.mem
+  const disk = stats?.disk
+  const swap = stats?.swap
+  const memUsed = mem ? mem.total - mem.available : 0
 
   const cpuPercent = stats?.cpu?.['_system'] ?? 0
-  const memPercent =
-    stats && stats.mem.total > 0
-      ? Math.round(
-          ((stats.mem.total - stats.mem.available) / stats.mem.total) * 100,
-        )
-      : 0
-  const diskPercent =
-    stats && stats.disk.total > 0
-      ? Math.round((stats.disk.used / stats.disk.total) * 100)
-      : 0
+  const memPercent = mem ? percentOf(memUsed, mem.total) : 0
+  const diskPercent = disk ? percentOf(disk.used, disk.total) : 0
 
   return (
     <div className="flex flex-col gap-6">
@@ -176,8 +155,8 @@ function HostSummaryPage() {
                     color="var(--color-success)"
                   />
                   <div className="text-center text-xs text-muted-foreground">
-                    {stats
-                      ? `${humanBytes(stats.mem.total - stats.mem.available)} / ${humanBytes(stats.mem.total)}`
+                    {mem
+                      ? `${humanBytes(memUsed)} / ${humanBytes(mem.total)}`
                       : '-'}
                   </div>
                 </div>
@@ -189,8 +168,8 @@ function HostSummaryPage() {
                   </div>
                   <div className="h-10" /> {/* spacer matching sparkline height */}
                   <div className="text-center text-xs text-muted-foreground">
-                    {stats
-                      ? `${humanBytes(stats.disk.used)} / ${humanBytes(stats.disk.total)}`
+                    {disk
+                      ? `${humanBytes(disk.used)} / ${humanBytes(disk.total)}`
                       : '-'}
                   </div>
                 </div>
@@ -220,15 +199,22 @@ function HostSummaryPage() {
                 <InfoRow
                   label="Swap"
                   value={
-                    stats?.swap
-                      ? `${humanBytes(stats.swap.used)} / ${humanBytes(stats.swap.total)}`
+                    swap
+                      ? `${humanBytes(swap.used)} / ${humanBytes(swap.total)}`
                       : '-'
                   }
                 />
-                <InfoRow
-                  label="Workspaces"
-                  value={`${counts.total} total (${counts.running} running)`}
-                />
+                <Await
+                  promise={counts}
+                  fallback={<InfoRow label="Workspaces" value="-" />}
+                >
+                  {(c) => (
+                    <InfoRow
+                      label="Workspaces"
+                      value={`${c.total} total (${c.running} running)`}
+                    />
+                  )}
+                </Await>
               </div>
             </CardContent>
           </Card>
@@ -243,30 +229,9 @@ function HostSummaryPage() {
               </CardTitle>
             </CardHeader>
             <CardContent>
-              <div className="grid grid-cols-2 gap-4">
-                <StatBox
-                  label="Total"
-                  value={counts.total}
-                  icon={<Box className="h-4 w-4 text-muted-foreground" />}
-                />
-                <StatBox
-                  label="Running"
-                  value={counts.running}
-                  icon={<span className="h-2.5 w-2.5 rounded-full bg-success" />}
-                  valueClass="text-success"
-                />
-                <StatBox
-                  label="Stopped"
-                  value={counts.stopped}
-                  icon={<span className="h-2.5 w-2.5 rounded-full bg-muted-foreground/40" />}
-                />
-                <StatBox
-                  label="Creating"
-                  value={counts.creating}
-                  icon={<span className="h-2.5 w-2.5 rounded-full bg-warning animate-pulse" />}
-                  valueClass="text-warning"
-                />
-              </div>
+              <Await promise={counts} fallback={<WorkspaceOverview counts={null} />}>
+                {(c) => <WorkspaceOverview counts={c} />}
+              </Await>
             </CardContent>
           </Card>
 
@@ -317,6 +282,36 @@ function InfoRow({ label, value }: { label: string; value: string }) {
   )
 }
 
+/** Workspace state tiles; `counts` is null while the listing is in flight. */
+function WorkspaceOverview({ counts }: { counts: WorkspaceCounts | null }) {
+  return (
+    <div className="grid grid-cols-2 gap-4">
+      <StatBox
+        label="Total"
+        value={counts?.total ?? '-'}
+        icon={<Box className="h-4 w-4 text-muted-foreground" />}
+      />
+      <StatBox
+        label="Running"
+        value={counts?.running ?? '-'}
+        icon={<span className="h-2.5 w-2.5 rounded-full bg-success" />}
+        valueClass="text-success"
+      />
+      <StatBox
+        label="Stopped"
+        value={counts?.stopped ?? '-'}
+        icon={<span className="h-2.5 w-2.5 rounded-full bg-muted-foreground/40" />}
+      />
+      <StatBox
+        label="Creating"
+        value={counts?.creating ?? '-'}
+        icon={<span className="h-2.5 w-2.5 rounded-full bg-warning animate-pulse" />}
+        valueClass="text-warning"
+      />
+    </div>
+  )
+}
+
 function StatBox({
   label,
   value,
@@ -324,7 +319,7 @@ function StatBox({
   valueClass,
 }: {
   label: string
-  value: number
+  value: number | string
   icon: React.ReactNode
   valueClass?: string
 }) {
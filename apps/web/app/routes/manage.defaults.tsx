@@ -5,6 +5,7 @@ import { Card, CardContent, CardHeader, CardTitle } from '~/components/ui/card'
 import { Button } from '~/components/ui/button'
 import { Input } from '~/components/ui/input'
 import { Label } from '~/components/ui/label'
+import { apiPost } from '~/lib/api-client'
 
 // ---------------------------------------------------------------------------
 // Types
@@ -61,19 +62,12 @@ function DefaultsPage() {
     setSaving(true)
     setMessage('')
     try {
-      const res = await fetch('/api/settings', {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-          'X-Requested-With': 'workspacekit',
-        },
-        body: JSON.stringify({
-          action: 'save-defaults',
-          req_cpu: reqCpu,
-          req_mem: reqMem,
-          lim_cpu: limCpu,
-          lim_mem: limMem,
-        }),
+      const res = await apiPost('/api/settings', {
+        action: 'save-defaults',
+        req_cpu: reqCpu,
+        req_mem: reqMem,
+        lim_cpu: limCpu,
+        lim_mem: limMem,
       })
       const data = await res.json()
       setMessage(data.message || 'Saved')
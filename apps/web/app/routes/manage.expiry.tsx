@@ -5,6 +5,7 @@ import { Card, CardContent, CardHeader, CardTitle } from '~/components/ui/card'
 import { Button } from '~/components/ui/button'
 import { Input } from '~/components/ui/input'
 import { Label } from '~/components/ui/label'
+import { apiPost } from '~/lib/api-client'
 
 // ---------------------------------------------------------------------------
 // Server functions
@@ -47,14 +48,7 @@ function ExpiryPage() {
     setSaving(true)
     setMessage('')
     try {
-      const res = await fetch('/api/expiry', {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-          'X-Requested-With': 'workspacekit',
-        },
-        body: JSON.stringify({ days: parseInt(days) || 0 }),
-      })
+      const res = await apiPost('/api/expiry', { days: parseInt(days) || 0 })
       const data = await res.json()
       setMessage(data.message || 'Saved')
     } catch {
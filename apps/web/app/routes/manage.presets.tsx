@@ -1,6 +1,6 @@
 import { createFileRoute } from '@tanstack/react-router'
 import { createServerFn } from '@tanstack/react-start'
-import { useState } from 'react'
+import { useState, useCallback, memo } from 'react'
 import type { Preset } from '@workspacekit/types'
 import { Card, CardContent, CardHeader, CardTitle } from '~/components/ui/card'
 import { Button } from '~/components/ui/button'
@@ -15,6 +15,7 @@ import {
   TableRow,
 } from '~/components/ui/table'
 import { Trash2 } from 'lucide-react'
+import { apiPost } from '~/lib/api-client'
 
 // ---------------------------------------------------------------------------
 // Server functions
@@ -41,6 +42,71 @@ export const Route = createFileRoute('/manage/presets')({
   component: PresetsPage,
 })
 
+// ---------------------------------------------------------------------------
+// Preset table
+// ---------------------------------------------------------------------------
+
+/**
+ * Memoized so typing in the create form below doesn't rebuild every
+ * preset row; it only re-renders when the preset list itself changes.
+ * Delete buttons carry `data-id` and share one click handler on the body.
+ */
+const PresetTable = memo(function PresetTable({
+  presets,
+  onDelete,
+}: {
+  presets: Preset[]
+  onDelete: (id: string) => void
+}) {
+  const handleClick = (e: React.MouseEvent) => {
+    const button = (e.target as Element).closest<HTMLElement>('[data-id]')
+    if (button?.dataset.id) onDelete(button.dataset.id)
+  }
+
+  return (
+    <Table>
+      <TableHeader>
+        <TableRow>
+          <TableHead>Name</TableHead>
+          <TableHead>Description</TableHead>
+          <TableHead>Repository</TableHead>
+          <TableHead>CPU</TableHead>
+          <TableHead>Memory</TableHead>
+          <TableHead className="w-10" />
+        </TableRow>
+      </TableHeader>
+      <TableBody onClick={handleClick}>
+        {presets.map((p) => (
+          <TableRow key={p.id}>
+            <TableCell className="font-medium">{p.name}</TableCell>
+            <TableCell className="text-muted-foreground text-xs max-w-40 truncate">
+              {p.description || '-'}
+            </TableCell>
+            <TableCell className="text-xs max-w-40 truncate">
+              {p.repo_url || '-'}
+            </TableCell>
+            <TableCell className="tabular-nums text-xs">
+              {p.req_cpu}/{p.lim_cpu}
+            </TableCell>
+            <TableCell className="tabular-nums text-xs">
+              {p.req_mem}/{p.lim_mem}
+            </TableCell>
+            <TableCell>
+              <Button
+                variant="ghost"
+                size="icon-xs"
+                data-id={p.id}
+              >
+                <Trash2 className="h-3 w-3 text-destructive" />
+              </Button>
+            </TableCell>
+          </TableRow>
+        ))}
+      </TableBody>
+    </Table>
+  )
+})
+
 // ---------------------------------------------------------------------------
 // Component
 // ---------------------------------------------------------------------------
@@ -62,22 +128,15 @@ function PresetsPage() {
     e.preventDefault()
     setMessage('')
     try {
-      const res = await fetch('/api/presets', {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-          'X-Requested-With': 'workspacekit',
-        },
-        body: JSON.stringify({
-          action: 'save',
-          name,
-          description,
-          repo_url: repoUrl,
-          req_cpu: reqCpu,
-          req_mem: reqMem,
-          lim_cpu: limCpu,
-          lim_mem: limMem,
-        }),
+      const res = await apiPost('/api/presets', {
+        action: 'save',
+        name,
+        description,
+        repo_url: repoUrl,
+        req_cpu: reqCpu,
+        req_mem: reqMem,
+        lim_cpu: limCpu,
+        lim_mem: limMem,
       })
       const data = await res.json()
       setMessage(data.message || 'Preset saved')
@@ -87,22 +146,15 @@ function PresetsPage() {
     }
   }
 
-  const handleDelete = async (id: string) => {
+  const handleDelete = useCallback(async (id: string) => {
     if (!confirm('Delete this preset?')) return
     try {
-      await fetch('/api/presets', {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-          'X-Requested-With': 'workspacekit',
-        },
-        body: JSON.stringify({ action: 'delete', id }),
-      })
+      await apiPost('/api/presets', { action: 'delete', id })
       window.location.reload()
     } catch {
       setMessage('Failed to delete preset')
     }
-  }
+  }, [])
 
   return (
     <div className="flex flex-col gap-4">
@@ -116,46 +168,7 @@ function PresetsPage() {
               No presets configured.
             </p>
           ) : (
-            <Table>
-              <TableHeader>
-                <TableRow>
-                  <TableHead>Name</TableHead>
-                  <TableHead>Description</TableHead>
-                  <TableHead>Repository</TableHead>
-                  <TableHead>CPU</TableHead>
-                  <TableHead>Memory</TableHead>
-                  <TableHead className="w-10" />
-                </TableRow>
-              </TableHeader>
-              <TableBody>
-                {presets.map((p) => (
-                  <TableRow key={p.id}>
-                    <TableCell className="font-medium">{p.name}</TableCell>
-                    <TableCell className="text-muted-foreground text-xs max-w-40 truncate">
-                      {p.description || '-'}
-                    </TableCell>
-                    <TableCell className="text-xs max-w-40 truncate">
-                      {p.repo_url || '-'}
-                    </TableCell>
-                    <TableCell className="tabular-nums text-xs">
-                      {p.req_cpu}/{p.lim_cpu}
-                    </TableCell>
-                    <TableCell className="tabular-nums text-xs">
-                      {p.req_mem}/{p.lim_mem}
-                    </TableCell>
-                    <TableCell>
-                      <Button
-                        variant="ghost"
-                        size="icon-xs"
-                        onClick={() => handleDelete(p.id)}
-                      >
-                        <Trash2 className="h-3 w-3 text-destructive" />
-                      </Button>
-                    </TableCell>
-                  </TableRow>
-                ))}
-              </TableBody>
-            </Table>
+            <PresetTable presets={presets} onDelete={handleDelete} />
           )}
         </CardContent>
       </Card>
@@ -6,6 +6,7 @@ import { Card, CardContent, CardHeader, CardTitle } from '~/components/ui/card'
 import { Button } from '~/components/ui/button'
 import { Input } from '~/components/ui/input'
 import { Label } from '~/components/ui/label'
+import { apiPost } from '~/lib/api-client'
 
 // ---------------------------------------------------------------------------
 // Server functions
@@ -66,19 +67,12 @@ function QuotaPage() {
     setLrSaving(true)
     setLrMessage('')
     try {
-      const res = await fetch('/api/settings', {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-          'X-Requested-With': 'workspacekit',
-        },
-        body: JSON.stringify({
-          action: 'save-limitrange',
-          max_cpu: lrMaxCpu,
-          max_mem: lrMaxMem,
-          def_req_cpu: lrDefReqCpu,
-          def_req_mem: lrDefReqMem,
-        }),
+      const res = await apiPost('/api/settings', {
+        action: 'save-limitrange',
+        max_cpu: lrMaxCpu,
+        max_mem: lrMaxMem,
+        def_req_cpu: lrDefReqCpu,
+        def_req_mem: lrDefReqMem,
       })
       const data = await res.json()
       setLrMessage(data.message || 'Saved')
@@ -94,18 +88,11 @@ function QuotaPage() {
     setQuotaSaving(true)
     setQuotaMessage('')
     try {
-      const res = await fetch('/api/settings', {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-          'X-Requested-With': 'workspacekit',
-        },
-        body: JSON.stringify({
-          action: 'save-quota',
-          req_cpu: quotaReqCpu,
-          req_mem: quotaReqMem,
-          pods: quotaPods,
-        }),
+      const res = await apiPost('/api/settings', {
+        action: 'save-quota',
+        req_cpu: quotaReqCpu,
+        req_mem: quotaReqMem,
+        pods: quotaPods,
       })
       const data = await res.json()
       setQuotaMessage(data.message || 'Saved')
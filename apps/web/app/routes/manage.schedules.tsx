@@ -16,6 +16,7 @@ import {
   TableRow,
 } from '~/components/ui/table'
 import { Trash2 } from 'lucide-react'
+import { apiPost } from '~/lib/api-client'
 
 // ---------------------------------------------------------------------------
 // Server functions
@@ -30,6 +31,15 @@ const fetchSchedules = createServerFn({ method: 'GET' }).handler(
   },
 )
 
+// ---------------------------------------------------------------------------
+// Formatting
+// ---------------------------------------------------------------------------
+
+/** Zero-padded `HH:MM` for a schedule's trigger time. */
+function formatScheduleTime(hour: number, minute: number): string {
+  return `${String(hour).padStart(2, '0')}:${String(minute).padStart(2, '0')}`
+}
+
 // ---------------------------------------------------------------------------
 // Route
 // ---------------------------------------------------------------------------
@@ -63,21 +73,14 @@ function SchedulesPage() {
     e.preventDefault()
     setMessage('')
     try {
-      const res = await fetch('/api/schedules', {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-          'X-Requested-With': 'workspacekit',
-        },
-        body: JSON.stringify({
-          action: 'set',
-          schedule_action: action,
-          workspace,
-          pod_name: podName,
-          days: days.split(',').map((d) => d.trim()),
-          hour: parseInt(hour),
-          minute: parseInt(minute),
-        }),
+      const res = await apiPost('/api/schedules', {
+        action: 'set',
+        schedule_action: action,
+        workspace,
+        pod_name: podName,
+        days: days.split(',').map((d) => d.trim()),
+        hour: parseInt(hour),
+        minute: parseInt(minute),
       })
       const data = await res.json()
       setMessage(data.message || 'Schedule added')
@@ -89,14 +92,7 @@ function SchedulesPage() {
 
   const handleRemove = async (ws: string, act: string) => {
     try {
-      await fetch('/api/schedules', {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-          'X-Requested-With': 'workspacekit',
-        },
-        body: JSON.stringify({ action: 'remove', workspace: ws, schedule_action: act }),
-      })
+      await apiPost('/api/schedules', { action: 'remove', workspace: ws, schedule_action: act })
       window.location.reload()
     } catch {
       setMessage('Failed to remove schedule')
@@ -138,8 +134,7 @@ function SchedulesPage() {
                       {s.days.join(', ')}
                     </TableCell>
                     <TableCell className="tabular-nums">
-                      {String(s.hour).padStart(2, '0')}:
-                      {String(s.minute).padStart(2, '0')}
+                      {formatScheduleTime(s.hour, s.minute)}
                     </TableCell>
                     <TableCell>
                       <Button
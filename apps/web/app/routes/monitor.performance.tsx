@@ -2,7 +2,8 @@ import { createFileRoute } from '@tanstack/react-router'
 import { createServerFn } from '@tanstack/react-start'
 import { useState, useEffect, useRef } from 'react'
 import type { SystemStats } from '@workspacekit/types'
-import { humanBytes } from '~/lib/utils'
+import { humanBytes, percentOf } from '~/lib/utils'
+import { useStatsPoll } from '~/lib/stats-poll'
 import { Card, CardContent, CardHeader, CardTitle } from '~/components/ui/card'
 import { Sparkline } from '~/components/charts'
 import {
@@ -53,56 +54,36 @@ function PerformancePage() {
 
   useEffect(() => {
     if (initialStats) {
+      const { mem, disk } = initialStats
       cpuHistory.current = [initialStats.cpu?.['_system'] ?? 0]
-      const memPct =
-        initialStats.mem.total > 0
-          ? Math.round(
-              ((initialStats.mem.total - initialStats.mem.available) /
-                initialStats.mem.total) *
-                100,
-            )
-          : 0
-      memHistory.current = [memPct]
-      diskHistory.current = [
-        initialStats.disk.total > 0
-          ? Math.round((initialStats.disk.used / initialStats.disk.total) * 100)
-          : 0,
-      ]
+      memHistory.current = [percentOf(mem.total - mem.available, mem.total)]
+      diskHistory.current = [percentOf(disk.used, disk.total)]
     }
   }, [])
 
-  useEffect(() => {
-    const interval = setInterval(async () => {
-      try {
-        const res = await fetch('/api/stats')
-        if (!res.ok) return
-        const data = (await res.json()) as SystemStats
-        setStats(data)
+  useStatsPoll((data) => {
+    setStats(data)
 
-        cpuHistory.current = [
-          ...cpuHistory.current.slice(-59),
-          data.cpu?.['_system'] ?? 0,
-        ]
-        const memPct =
-          data.mem.total > 0
-            ? Math.round(
-                ((data.mem.total - data.mem.available) / data.mem.total) * 100,
-              )
-            : 0
-        memHistory.current = [...memHistory.current.slice(-59), memPct]
-        diskHistory.current = [
-          ...diskHistory.current.slice(-59),
-          data.disk.total > 0
-            ? Math.round((data.disk.used / data.disk.total) * 100)
-            : 0,
-        ]
-        forceUpdate((n) => n + 1)
-      } catch {
-        // ignore
-      }
-    }, 5000)
-    return () => clearInterval(interval)
-  }, [])
+    cpuHistory.current = [
+      ...cpuHistory.current.slice(-59),
+      data.cpu?.['_system'] ?? 0,
+    ]
+    const { mem, disk } = data
+    memHistory.current = [
+      ...memHistory.current.slice(-59),
+      percentOf(mem.total - mem.available, mem.total),
+    ]
+    diskHistory.current = [
+      ...diskHistory.current.slice(-59),
+      percentOf(disk.used, disk.total),
+    ]
+    forceUpdate((n) => n + 1)
+  })
+
+  // Bind the nested stats objects once; they are read several times below.
+  const mem = stats?.mem
+  const disk = stats?.disk
+  const memUsed = mem ? mem.total - mem.available : 0
 
   return (
     <div className="flex flex-col gap-6">
@@ -134,14 +115,7 @@ function PerformancePage() {
         <Card className="border-border bg-card shadow-[var(--shadow-card)]">
           <CardHeader className="pb-2">
             <CardTitle className="text-sm text-muted-foreground">
-              Memory (
-              {stats && stats.mem.total > 0
-                ? Math.round(
-                    ((stats.mem.total - stats.mem.available) / stats.mem.total) *
-                      100,
-                  )
-                : 0}
-              %)
+              Memory ({mem ? percentOf(memUsed, mem.total) : 0}%)
             </CardTitle>
           </CardHeader>
           <CardContent>
@@ -152,8 +126,8 @@ function PerformancePage() {
               color="var(--color-success)"
             />
             <div className="mt-2 text-xs text-muted-foreground">
-              {stats
-                ? `${humanBytes(stats.mem.total - stats.mem.available)} / ${humanBytes(stats.mem.total)}`
+              {mem
+                ? `${humanBytes(memUsed)} / ${humanBytes(mem.total)}`
                 : '-'}
             </div>
           </CardContent>
@@ -162,11 +136,7 @@ function PerformancePage() {
         <Card className="border-border bg-card shadow-[var(--shadow-card)]">
           <CardHeader className="pb-2">
             <CardTitle className="text-sm text-muted-foreground">
-              Disk (
-              {stats && stats.disk.total > 0
-                ? Math.round((stats.disk.used / stats.disk.total) * 100)
-                : 0}
-              %)
+              Disk ({disk ? percentOf(disk.used, disk.total) : 0}%)
             </CardTitle>
           </CardHeader>
           <CardContent>
@@ -177,8 +147,8 @@ function PerformancePage() {
               color="var(--color-warning)"
             />
             <div className="mt-2 text-xs text-muted-foreground">
-              {stats
-                ? `${humanBytes(stats.disk.used)} / ${humanBytes(stats.disk.total)}`
+              {disk
+                ? `${humanBytes(disk.used)} / ${humanBytes(disk.total)}`
                 : '-'}
             </div>
           </CardContent>
@@ -1,7 +1,8 @@
 import { createFileRoute, Link } from '@tanstack/react-router'
 import { createServerFn } from '@tanstack/react-start'
-import { useState, useEffect, useRef, useCallback } from 'react'
+import { useState, useEffect, useRef, useCallback, useMemo } from 'react'
 import { Terminal as TerminalComponent } from '@workspacekit/ui'
+import xtermCss from '@xterm/xterm/css/xterm.css?url'
 import type { WorkspaceDetail, UsageEntry } from '@workspacekit/types'
 import { cn } from '~/lib/cn'
 import { Button } from '~/components/ui/button'
@@ -27,6 +28,8 @@ import {
 } from '~/components/ui/dialog'
 import { Gauge, Sparkline } from '~/components/charts'
 import { addTask, updateTask } from '~/lib/task-store'
+import { apiPost } from '~/lib/api-client'
+import { vscodeUrl } from '~/lib/utils'
 import { CreationProgress } from '~/components/creation-progress'
 import {
   Play,
@@ -56,13 +59,16 @@ const fetchWorkspaceDetail = createServerFn({ method: 'GET' })
     return getWorkspaceDetail({ data })
   })
 
+/** The usage sparklines are 400px wide; more points than this are invisible. */
+const USAGE_HISTORY_POINTS = 200
+
 const fetchUsageHistory = createServerFn({ method: 'GET' })
   .validator((input: { pod: string }) => input)
   .handler(async ({ data }): Promise<UsageEntry[]> => {
     const { requireServerFnAuth } = await import('~/server/auth')
     await requireServerFnAuth()
     const { getUsageHistory } = await import('~/server/stats')
-    return getUsageHistory(data.pod)
+    return getUsageHistory(data.pod, USAGE_HISTORY_POINTS)
   })
 
 // ---------------------------------------------------------------------------
@@ -70,18 +76,133 @@ const fetchUsageHistory = createServerFn({ method: 'GET' })
 // ---------------------------------------------------------------------------
 
 export const Route = createFileRoute('/workspace/$uid')({
+  // The terminal is the only consumer of xterm's stylesheet, so it is linked
+  // from this route's head instead of shipping with every page.
+  head: () => ({ links: [{ rel: 'stylesheet', href: xtermCss }] }),
   loader: async ({ params }) => {
-    const detail = await fetchWorkspaceDetail({
-      data: { uid: params.uid },
-    })
-    const usageHistory = detail?.pod
-      ? await fetchUsageHistory({ data: { pod: detail.pod } })
-      : []
+    // Workspace pods are named ws-<uid>, so the usage history request does
+    // not have to wait for the detail lookup; both round trips overlap. Only
+    // a pod under some other name needs a second, dependent fetch.
+    const expectedPod = `ws-${params.uid}`
+    const [detail, expectedHistory] = await Promise.all([
+      fetchWorkspaceDetail({ data: { uid: params.uid } }),
+      fetchUsageHistory({ data: { pod: expectedPod } }),
+    ])
+    let usageHistory: UsageEntry[] = []
+    if (detail?.pod === expectedPod) {
+      usageHistory = expectedHistory
+    } else if (detail?.pod) {
+      usageHistory = await fetchUsageHistory({ data: { pod: detail.pod } })
+    }
     return { detail, usageHistory }
   },
   component: WorkspaceDetailPage,
 })
 
+// ---------------------------------------------------------------------------
+// Limit parsing
+// ---------------------------------------------------------------------------
+
+/** Parses a CPU limit ("500m", "2") to millicores; unset means one core. */
+function parseCpuLimit(lim: string): number {
+  if (!lim) return 1000
+  if (lim.endsWith('m')) return parseInt(lim)
+  return parseFloat(lim) * 1000
+}
+
+/** Parses a memory limit ("512Mi", "2Gi") to bytes; unset means 1Gi. */
+function parseMemLimit(lim: string): number {
+  if (!lim) return 1024 * 1024 * 1024
+  if (lim.endsWith('Gi')) return parseFloat(lim) * 1024 * 1024 * 1024
+  if (lim.endsWith('Mi')) return parseFloat(lim) * 1024 * 1024
+  if (lim.endsWith('Ki')) return parseFloat(lim) * 1024
+  return parseFloat(lim)
+}
+
+// ---------------------------------------------------------------------------
+// Host info
+// ---------------------------------------------------------------------------
+
+interface HostInfo {
+  /** Host the dashboard was loaded from; workspace NodePorts live there too. */
+  hostname: string
+  /** ws:// or wss:// origin of the dashboard, for the terminal socket. */
+  wsOrigin: string
+}
+
+/** Used while server rendering, where there is no browser location. */
+const SSR_HOST_INFO: HostInfo = { hostname: 'localhost', wsOrigin: 'ws://localhost:3000' }
+
+let browserHostInfo: HostInfo | null = null
+
+/**
+ * Returns where the dashboard is being served from. The location cannot
+ * change without a full page load, so the browser value is read once.
+ */
+function getHostInfo(): HostInfo {
+  if (typeof window === 'undefined') return SSR_HOST_INFO
+  if (!browserHostInfo) {
+    const { protocol, hostname, host } = window.location
+    browserHostInfo = {
+      hostname,
+      wsOrigin: `${protocol === 'https:' ? 'wss' : 'ws'}://${host}`,
+    }
+  }
+  return browserHostInfo
+}
+
+// ---------------------------------------------------------------------------
+// Static fragments
+// ---------------------------------------------------------------------------
+
+// Elements with no per-workspace data are created once. React sees the same
+// element on every render and skips diffing them.
+
+const NO_USAGE_HISTORY = (
+  <p className="text-sm text-muted-foreground">No usage data available yet.</p>
+)
+const NO_EVENTS = <p className="text-sm text-muted-foreground">No events recorded.</p>
+const NO_CONTAINERS = <p className="text-sm text-muted-foreground">No containers found.</p>
+const NO_PVCS = <p className="text-sm text-muted-foreground">No PVCs found.</p>
+const TERMINAL_HINT = (
+  <p className="text-sm text-muted-foreground">
+    Click "Connect" to open a terminal session.
+  </p>
+)
+
+const EVENTS_HEADER = (
+  <TableHeader>
+    <TableRow>
+      <TableHead className="w-24">Type</TableHead>
+      <TableHead className="w-36">Reason</TableHead>
+      <TableHead className="w-24">Age</TableHead>
+      <TableHead>Message</TableHead>
+    </TableRow>
+  </TableHeader>
+)
+
+const CONTAINERS_HEADER = (
+  <TableHeader>
+    <TableRow>
+      <TableHead>Name</TableHead>
+      <TableHead>Image</TableHead>
+      <TableHead>Status</TableHead>
+      <TableHead className="text-right">Restarts</TableHead>
+    </TableRow>
+  </TableHeader>
+)
+
+const PVCS_HEADER = (
+  <TableHeader>
+    <TableRow>
+      <TableHead>Name</TableHead>
+      <TableHead>Capacity</TableHead>
+      <TableHead>Status</TableHead>
+      <TableHead>Storage Class</TableHead>
+    </TableRow>
+  </TableHeader>
+)
+
 // ---------------------------------------------------------------------------
 // StatusBadge helper
 // ---------------------------------------------------------------------------
@@ -131,11 +252,39 @@ function StatusBadge({
 // LogViewer (SSE)
 // ---------------------------------------------------------------------------
 
+/** Oldest lines are dropped once the viewer holds this many. */
+const MAX_LOG_LINES = 5_000
+
 function LogViewer({ pod }: { pod: string }) {
   const [lines, setLines] = useState<string[]>([])
   const [streaming, setStreaming] = useState(false)
   const containerRef = useRef<HTMLDivElement>(null)
   const eventSourceRef = useRef<EventSource | null>(null)
+  // Lines received since the last frame; flushed into state once per frame
+  // so a chatty container costs one render per frame, not one per line.
+  const pendingRef = useRef<string[]>([])
+  const frameRef = useRef<number | null>(null)
+
+  const flushPending = useCallback(() => {
+    frameRef.current = null
+    const batch = pendingRef.current
+    pendingRef.current = []
+    setLines((prev) => {
+      const next = prev.concat(batch)
+      return next.length > MAX_LOG_LINES ? next.slice(-MAX_LOG_LINES) : next
+    })
+    requestAnimationFrame(() => {
+      if (containerRef.current) {
+        containerRef.current.scrollTop = containerRef.current.scrollHeight
+      }
+    })
+  }, [])
+
+  const cancelFlush = useCallback(() => {
+    if (frameRef.current !== null) cancelAnimationFrame(frameRef.current)
+    frameRef.current = null
+    pendingRef.current = []
+  }, [])
 
   const startStream = useCallback(() => {
     if (eventSourceRef.current) eventSourceRef.current.close()
@@ -144,33 +293,44 @@ function LogViewer({ pod }: { pod: string }) {
     setStreaming(true)
 
     es.onmessage = (event) => {
-      setLines((prev) => [...prev, event.data])
-      requestAnimationFrame(() => {
-        if (containerRef.current) {
-          containerRef.current.scrollTop = containerRef.current.scrollHeight
-        }
-      })
+      const pending = pendingRef.current
+      pending.push(event.data)
+      // Animation frames do not run in background tabs, so the batch can
+      // grow until the tab is shown again. Only the newest MAX_LOG_LINES
+      // could ever be displayed; trim in bulk to keep pushes cheap.
+      if (pending.length > 2 * MAX_LOG_LINES) {
+        pending.splice(0, pending.length - MAX_LOG_LINES)
+      }
+      if (frameRef.current === null) {
+        frameRef.current = requestAnimationFrame(flushPending)
+      }
     }
 
     es.onerror = () => {
       setStreaming(false)
       es.close()
     }
-  }, [pod])
+  }, [pod, flushPending])
 
   const stopStream = useCallback(() => {
     if (eventSourceRef.current) {
       eventSourceRef.current.close()
       eventSourceRef.current = null
     }
+    // Show whatever arrived before the stream was closed.
+    if (frameRef.current !== null) {
+      cancelAnimationFrame(frameRef.current)
+      flushPending()
+    }
     setStreaming(false)
-  }, [])
+  }, [flushPending])
 
   useEffect(() => {
     return () => {
       if (eventSourceRef.current) eventSourceRef.current.close()
+      cancelFlush()
     }
-  }, [])
+  }, [cancelFlush])
 
   return (
     <div className="flex flex-col gap-3">
@@ -188,7 +348,14 @@ function LogViewer({ pod }: { pod: string }) {
               Stop
             </Button>
           )}
-          <Button variant="ghost" size="xs" onClick={() => setLines([])}>
+          <Button
+            variant="ghost"
+            size="xs"
+            onClick={() => {
+              cancelFlush()
+              setLines([])
+            }}
+          >
             Clear
           </Button>
         </div>
@@ -231,11 +398,20 @@ function WorkspaceDetailPage() {
     )
   }
 
-  const hostIp = typeof window !== 'undefined' ? window.location.hostname : 'localhost'
-  const wsProtocol =
-    typeof window !== 'undefined' && window.location.protocol === 'https:' ? 'wss' : 'ws'
-  const wsPort = typeof window !== 'undefined' ? window.location.port : '3000'
-  const terminalWsUrl = `${wsProtocol}://${hostIp}${wsPort ? `:${wsPort}` : ''}/api/terminal/${encodeURIComponent(detail.pod ?? `ws-${detail.uid}`)}`
+  // Keyed by uid so navigating to another workspace starts from fresh form
+  // state; the view's hooks never sit behind the not-found early return.
+  return <WorkspaceDetailView key={detail.uid} detail={detail} usageHistory={usageHistory} />
+}
+
+function WorkspaceDetailView({
+  detail,
+  usageHistory,
+}: {
+  detail: WorkspaceDetail
+  usageHistory: UsageEntry[]
+}) {
+  const { hostname: hostIp, wsOrigin } = getHostInfo()
+  const terminalWsUrl = `${wsOrigin}/api/terminal/${encodeURIComponent(detail.pod ?? `ws-${detail.uid}`)}`
 
   // --- Action handler ---
   const fireAction = async (action: string, body: Record<string, unknown>) => {
@@ -244,14 +420,7 @@ function WorkspaceDetailPage() {
     }
     const taskId = addTask(action as 'start' | 'stop' | 'delete' | 'rebuild', detail.name)
     try {
-      await fetch('/api/workspaces', {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-          'X-Requested-With': 'workspacekit',
-        },
-        body: JSON.stringify({ action, ...body }),
-      })
+      await apiPost('/api/workspaces', { action, ...body })
       updateTask(taskId, { status: 'completed' })
       if (action === 'delete') {
         window.location.href = '/workspaces'
@@ -276,35 +445,28 @@ function WorkspaceDetailPage() {
   const [showTerminal, setShowTerminal] = useState(false)
 
   // --- Sparkline data from usage history ---
-  const cpuData = usageHistory.map((e) => e.cpu_mc)
-  const memData = usageHistory.map((e) => e.mem_bytes / (1024 * 1024))
+  // Memoized so typing in the resize form doesn't hand the sparklines new
+  // arrays on every keystroke.
+  const cpuData = useMemo(() => usageHistory.map((e) => e.cpu_mc), [usageHistory])
+  const memData = useMemo(
+    () => usageHistory.map((e) => e.mem_bytes / (1024 * 1024)),
+    [usageHistory],
+  )
 
   // --- CPU/Mem gauge values ---
   const cpuUsageMc = usageHistory.length > 0 ? usageHistory[usageHistory.length - 1].cpu_mc : 0
   const memUsageBytes =
     usageHistory.length > 0 ? usageHistory[usageHistory.length - 1].mem_bytes : 0
 
-  // Parse limit to compute percentage
-  function parseCpuLimit(lim: string): number {
-    if (!lim) return 1000
-    if (lim.endsWith('m')) return parseInt(lim)
-    return parseFloat(lim) * 1000
-  }
-  function parseMemLimit(lim: string): number {
-    if (!lim) return 1024 * 1024 * 1024
-    if (lim.endsWith('Gi')) return parseFloat(lim) * 1024 * 1024 * 1024
-    if (lim.endsWith('Mi')) return parseFloat(lim) * 1024 * 1024
-    if (lim.endsWith('Ki')) return parseFloat(lim) * 1024
-    return parseFloat(lim)
-  }
-
   const cpuLimitMc = parseCpuLimit(detail.resources.lim_cpu)
   const memLimitBytes = parseMemLimit(detail.resources.lim_mem)
   const cpuPercent = cpuLimitMc > 0 ? Math.round((cpuUsageMc / cpuLimitMc) * 100) : 0
   const memPercent = memLimitBytes > 0 ? Math.round((memUsageBytes / memLimitBytes) * 100) : 0
 
   // --- Info rows ---
-  const infoRows: Array<{ label: string; value: React.ReactNode }> = [
+  // Built once per loaded detail; the resize form re-renders the page on
+  // every keystroke and none of these values depend on it.
+  const infoRows = useMemo((): Array<{ label: string; value: React.ReactNode }> => [
     { label: 'Name', value: detail.name },
     { label: 'Status', value: detail.status },
     { label: 'Phase', value: detail.phase },
@@ -332,7 +494,7 @@ function WorkspaceDetailPage() {
     },
     { label: 'Last Commit', value: <code className="text-xs">{detail.last_commit || '-'}</code> },
     { label: 'Last Accessed', value: detail.last_accessed || '-' },
-  ]
+  ], [detail])
 
   return (
     <div className="flex flex-col gap-4">
@@ -348,10 +510,7 @@ function WorkspaceDetailPage() {
           <Button
             size="xs"
             onClick={() =>
-              window.open(
-                `http://${hostIp}:${detail.port}/?tkn=${detail.uid}&folder=/workspace/${detail.name}`,
-                '_blank',
-              )
+              window.open(vscodeUrl(hostIp, detail.port, detail.uid, detail.name), '_blank')
             }
           >
             <ExternalLink className="h-3 w-3" />
@@ -569,7 +728,7 @@ function WorkspaceDetailPage() {
                 </CardHeader>
                 <CardContent>
                   {usageHistory.length === 0 ? (
-                    <p className="text-sm text-muted-foreground">No usage data available yet.</p>
+                    NO_USAGE_HISTORY
                   ) : (
                     <div className="grid gap-6 lg:grid-cols-2">
                       <div>
@@ -592,17 +751,10 @@ function WorkspaceDetailPage() {
                 </CardHeader>
                 <CardContent>
                   {detail.events.length === 0 ? (
-                    <p className="text-sm text-muted-foreground">No events recorded.</p>
+                    NO_EVENTS
                   ) : (
                     <Table>
-                      <TableHeader>
-                        <TableRow>
-                          <TableHead className="w-24">Type</TableHead>
-                          <TableHead className="w-36">Reason</TableHead>
-                          <TableHead className="w-24">Age</TableHead>
-                          <TableHead>Message</TableHead>
-                        </TableRow>
-                      </TableHeader>
+                      {EVENTS_HEADER}
                       <TableBody>
                         {detail.events.map((event, i) => (
                           <TableRow key={i}>
@@ -634,17 +786,10 @@ function WorkspaceDetailPage() {
                 </CardHeader>
                 <CardContent>
                   {detail.containers.length === 0 ? (
-                    <p className="text-sm text-muted-foreground">No containers found.</p>
+                    NO_CONTAINERS
                   ) : (
                     <Table>
-                      <TableHeader>
-                        <TableRow>
-                          <TableHead>Name</TableHead>
-                          <TableHead>Image</TableHead>
-                          <TableHead>Status</TableHead>
-                          <TableHead className="text-right">Restarts</TableHead>
-                        </TableRow>
-                      </TableHeader>
+                      {CONTAINERS_HEADER}
                       <TableBody>
                         {detail.containers.map((c, i) => (
                           <TableRow key={i}>
@@ -673,17 +818,10 @@ function WorkspaceDetailPage() {
                 </CardHeader>
                 <CardContent>
                   {detail.pvcs.length === 0 ? (
-                    <p className="text-sm text-muted-foreground">No PVCs found.</p>
+                    NO_PVCS
                   ) : (
                     <Table>
-                      <TableHeader>
-                        <TableRow>
-                          <TableHead>Name</TableHead>
-                          <TableHead>Capacity</TableHead>
-                          <TableHead>Status</TableHead>
-                          <TableHead>Storage Class</TableHead>
-                        </TableRow>
-                      </TableHeader>
+                      {PVCS_HEADER}
                       <TableBody>
                         {detail.pvcs.map((pvc, i) => (
                           <TableRow key={i}>
@@ -734,9 +872,7 @@ function WorkspaceDetailPage() {
                   {showTerminal ? (
                     <TerminalComponent podName={detail.pod} wsUrl={terminalWsUrl} />
                   ) : (
-                    <p className="text-sm text-muted-foreground">
-                      Click "Connect" to open a terminal session.
-                    </p>
+                    TERMINAL_HINT
                   )}
                 </CardContent>
               </Card>
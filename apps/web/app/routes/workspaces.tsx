@@ -1,8 +1,8 @@
 import { createFileRoute, Link, useRouter } from '@tanstack/react-router'
 import { createServerFn } from '@tanstack/react-start'
-import { useState, useCallback, useMemo } from 'react'
+import { useState, useCallback, useMemo, memo } from 'react'
 import type { Workspace, SystemStats, Settings } from '@workspacekit/types'
-import { humanBytes } from '~/lib/utils'
+import { humanBytes, vscodeUrl } from '~/lib/utils'
 import { cn } from '~/lib/cn'
 import { Card, CardContent, CardHeader } from '~/components/ui/card'
 import { Button } from '~/components/ui/button'
@@ -32,6 +32,7 @@ import {
 } from '~/components/ui/context-menu'
 import { ActionToolbar, type ViewMode } from '~/components/action-toolbar'
 import { addTask, updateTask } from '~/lib/task-store'
+import { apiPost } from '~/lib/api-client'
 import {
   Play,
   Square,
@@ -74,70 +75,237 @@ export const Route = createFileRoute('/workspaces')({
 // Helpers
 // ---------------------------------------------------------------------------
 
-function statusColor(ws: Workspace) {
-  if (ws.creating) return 'warning'
-  if (ws.running) return 'default'
-  if (ws.status === 'Failed' || ws.status === 'Error') return 'destructive'
-  return 'secondary'
+type StatusVariant = 'default' | 'secondary' | 'destructive' | 'warning'
+
+interface WorkspaceStatus {
+  label: string
+  variant: StatusVariant
+  dot: string
+}
+
+/**
+ * Resolves the label, badge variant and dot class for a workspace in one
+ * pass so each row walks the status conditions once instead of once per cell.
+ */
+function workspaceStatus(ws: Workspace): WorkspaceStatus {
+  if (ws.creating) {
+    return { label: 'Creating', variant: 'warning', dot: 'bg-warning animate-pulse' }
+  }
+  if (ws.running) {
+    return { label: 'Running', variant: 'default', dot: 'bg-success' }
+  }
+  if (ws.status === 'Failed' || ws.status === 'Error') {
+    return { label: ws.status, variant: 'destructive', dot: 'bg-destructive' }
+  }
+  return { label: 'Stopped', variant: 'secondary', dot: 'bg-muted-foreground/40' }
 }
 
 function statusLabel(ws: Workspace) {
-  if (ws.creating) return 'Creating'
-  if (ws.running) return 'Running'
-  if (ws.status === 'Failed' || ws.status === 'Error') return ws.status
-  return 'Stopped'
+  return workspaceStatus(ws).label
 }
 
-function StatusDot({ ws }: { ws: Workspace }) {
-  if (ws.creating) return <span className="h-2 w-2 rounded-full bg-warning animate-pulse" />
-  if (ws.running) return <span className="h-2 w-2 rounded-full bg-success" />
-  if (ws.status === 'Failed' || ws.status === 'Error')
-    return <span className="h-2 w-2 rounded-full bg-destructive" />
-  return <span className="h-2 w-2 rounded-full bg-muted-foreground/40" />
+function StatusDot({ status }: { status: WorkspaceStatus }) {
+  return <span className={`h-2 w-2 rounded-full ${status.dot}`} />
+}
+
+/** Shared class list for the row / header selection checkboxes. */
+const CHECKBOX_CLASS = 'h-3.5 w-3.5 rounded border-border accent-primary'
+
+const REPO_PREFIX_RE = /^https?:\/\/(github\.com\/)?/
+const REPO_SUFFIX_RE = /\.git$/
+
+/** Strips the scheme, GitHub host and .git suffix for display. */
+function shortRepo(repo: string): string {
+  return repo.replace(REPO_PREFIX_RE, '').replace(REPO_SUFFIX_RE, '')
 }
 
 type SortCol = 'status' | 'name' | 'cpu' | 'memory' | 'owner' | 'repo' | 'branch' | 'age'
 type SortDir = 'asc' | 'desc'
 
+/** Extracts the string a workspace is ordered by for the given column. */
+function sortKey(ws: Workspace, col: SortCol): string {
+  switch (col) {
+    case 'status':
+      return statusLabel(ws)
+    case 'name':
+      return ws.name
+    case 'cpu':
+      return ws.usage?.cpu ?? ''
+    case 'memory':
+      return ws.usage?.memory ?? ''
+    case 'owner':
+      return ws.owner ?? ''
+    case 'repo':
+      return ws.repo ?? ''
+    case 'branch':
+      return ws.branch ?? ''
+    case 'age':
+      return ws.last_accessed ?? ''
+  }
+}
+
+/** Same ordering as String#localeCompare, without re-resolving the locale per call. */
+const collator = new Intl.Collator()
+
 function sortWorkspaces(
   list: Workspace[],
   col: SortCol,
   dir: SortDir,
 ): Workspace[] {
-  const sorted = [...list]
-  sorted.sort((a, b) => {
-    let cmp = 0
-    switch (col) {
-      case 'status':
-        cmp = statusLabel(a).localeCompare(statusLabel(b))
-        break
-      case 'name':
-        cmp = a.name.localeCompare(b.name)
-        break
-      case 'cpu':
-        cmp = (a.usage?.cpu ?? '').localeCompare(b.usage?.cpu ?? '')
-        break
-      case 'memory':
-        cmp = (a.usage?.memory ?? '').localeCompare(b.usage?.memory ?? '')
-        break
-      case 'owner':
-        cmp = (a.owner ?? '').localeCompare(b.owner ?? '')
-        break
-      case 'repo':
-        cmp = (a.repo ?? '').localeCompare(b.repo ?? '')
-        break
-      case 'branch':
-        cmp = (a.branch ?? '').localeCompare(b.branch ?? '')
-        break
-      case 'age':
-        cmp = (a.last_accessed ?? '').localeCompare(b.last_accessed ?? '')
-        break
-    }
-    return dir === 'asc' ? cmp : -cmp
-  })
-  return sorted
+  // Compute each key once up front instead of twice per comparison.
+  const keyed = list.map((ws) => ({ ws, key: sortKey(ws, col) }))
+  const sign = dir === 'asc' ? 1 : -1
+  keyed.sort((a, b) => sign * collator.compare(a.key, b.key))
+  return keyed.map((k) => k.ws)
+}
+
+/**
+ * Sortable column header. Defined at module level so React keeps the same
+ * component type across renders instead of remounting every header.
+ */
+function SortHeader({
+  col,
+  label,
+  onSort,
+}: {
+  col: SortCol
+  label: string
+  onSort: (col: SortCol) => void
+}) {
+  return (
+    <TableHead
+      className="cursor-pointer select-none hover:text-foreground"
+      onClick={() => onSort(col)}
+    >
+      <span className="flex items-center gap-1">
+        {label}
+        <ArrowUpDown className="h-3 w-3" />
+      </span>
+    </TableHead>
+  )
 }
 
+/**
+ * One table row plus its context menu. Memoized so toggling selection or
+ * typing in the filter only re-renders the rows whose props changed.
+ * Menu items only carry `data-action` / `data-ws`; the page handles the
+ * click once for the whole table.
+ */
+const WorkspaceTableRow = memo(function WorkspaceTableRow({
+  ws,
+  selected,
+  onToggle,
+}: {
+  ws: Workspace
+  selected: boolean
+  onToggle: (name: string) => void
+}) {
+  const status = workspaceStatus(ws)
+  return (
+    <ContextMenu>
+      <ContextMenuTrigger asChild>
+        <TableRow
+          className={cn('cursor-default', selected && 'bg-accent/50')}
+        >
+          <TableCell>
+            <input
+              type="checkbox"
+              checked={selected}
+              onChange={() => onToggle(ws.name)}
+              className={CHECKBOX_CLASS}
+            />
+          </TableCell>
+          <TableCell>
+            <span className="flex items-center gap-2">
+              <StatusDot status={status} />
+              <span className="text-xs">{status.label}</span>
+            </span>
+          </TableCell>
+          <TableCell>
+            <Link
+              to="/workspace/$uid"
+              params={{ uid: ws.uid }}
+              className="font-medium text-primary hover:underline"
+            >
+              {ws.name}
+            </Link>
+          </TableCell>
+          <TableCell className="tabular-nums text-xs">
+            {ws.usage?.cpu ?? '-'}
+          </TableCell>
+          <TableCell className="tabular-nums text-xs">
+            {ws.usage?.memory ?? '-'}
+          </TableCell>
+          <TableCell className="text-xs text-muted-foreground">
+            {ws.owner || '-'}
+          </TableCell>
+          <TableCell className="text-xs text-muted-foreground max-w-40 truncate">
+            {ws.repo ? shortRepo(ws.repo) : '-'}
+          </TableCell>
+          <TableCell className="text-xs text-muted-foreground">
+            {ws.branch || '-'}
+          </TableCell>
+          <TableCell className="text-xs text-muted-foreground tabular-nums">
+            {ws.last_accessed || '-'}
+          </TableCell>
+        </TableRow>
+      </ContextMenuTrigger>
+      <ContextMenuContent>
+        {ws.running && ws.port > 0 && (
+          <ContextMenuItem
+            data-action="open-vscode"
+            data-ws={ws.name}
+          >
+            <ExternalLink className="h-3.5 w-3.5" />
+            Open VSCode
+          </ContextMenuItem>
+        )}
+        {!ws.running && !ws.creating && (
+          <ContextMenuItem
+            data-action="start"
+            data-ws={ws.name}
+          >
+            <Play className="h-3.5 w-3.5 text-success" />
+            Start
+          </ContextMenuItem>
+        )}
+        {ws.running && (
+          <ContextMenuItem
+            data-action="stop"
+            data-ws={ws.name}
+          >
+            <Square className="h-3.5 w-3.5 text-warning" />
+            Stop
+          </ContextMenuItem>
+        )}
+        <ContextMenuItem
+          data-action="rebuild"
+          data-ws={ws.name}
+        >
+          <RotateCcw className="h-3.5 w-3.5" />
+          Rebuild
+        </ContextMenuItem>
+        <ContextMenuItem
+          data-action="duplicate"
+          data-ws={ws.name}
+        >
+          <Copy className="h-3.5 w-3.5" />
+          Duplicate
+        </ContextMenuItem>
+        <ContextMenuSeparator />
+        <ContextMenuItem
+          variant="destructive"
+          data-action="delete"
+          data-ws={ws.name}
+        >
+          <Trash2 className="h-3.5 w-3.5" />
+          Delete
+        </ContextMenuItem>
+      </ContextMenuContent>
+    </ContextMenu>
+  )
+})
+
 // ---------------------------------------------------------------------------
 // Component
 // ---------------------------------------------------------------------------
@@ -175,19 +343,24 @@ function WorkspacesPage() {
   }, [workspaces])
 
   // --- Filtered + sorted list ---
+  // Lowercase the searchable fields once per workspace list rather than on
+  // every keystroke for every row.
+  const searchKeys = useMemo(
+    () =>
+      workspaces.map((w) =>
+        `${w.name}\n${w.repo ?? ''}\n${w.owner ?? ''}`.toLowerCase(),
+      ),
+    [workspaces],
+  )
+
   const filteredList = useMemo(() => {
     let list = workspaces
     if (filterText) {
       const lower = filterText.toLowerCase()
-      list = list.filter(
-        (w) =>
-          w.name.toLowerCase().includes(lower) ||
-          (w.repo ?? '').toLowerCase().includes(lower) ||
-          (w.owner ?? '').toLowerCase().includes(lower),
-      )
+      list = list.filter((_, i) => searchKeys[i].includes(lower))
     }
     return sortWorkspaces(list, sort.col, sort.dir)
-  }, [workspaces, filterText, sort])
+  }, [workspaces, searchKeys, filterText, sort])
 
   const selectedWorkspaces = workspaces.filter((w) => selected.has(w.name))
 
@@ -219,14 +392,7 @@ function WorkspacesPage() {
       if (formLimCpu) body.lim_cpu = formLimCpu
       if (formLimMem) body.lim_mem = formLimMem
 
-      const res = await fetch('/api/workspaces', {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-          'X-Requested-With': 'workspacekit',
-        },
-        body: JSON.stringify({ action: 'create', ...body }),
-      })
+      const res = await apiPost('/api/workspaces', { action: 'create', ...body })
       if (!res.ok) {
         const data = await res.json().catch(() => ({ message: 'Create failed' }))
         throw new Error(data.message || 'Create failed')
@@ -250,7 +416,7 @@ function WorkspacesPage() {
   }
 
   // --- Action handlers ---
-  const fireAction = async (
+  const fireAction = useCallback(async (
     action: string,
     targets: Workspace[],
   ) => {
@@ -259,10 +425,7 @@ function WorkspacesPage() {
     if (action === 'open-vscode') {
       for (const ws of targets) {
         if (ws.running && ws.port > 0) {
-          window.open(
-            `http://${window.location.hostname}:${ws.port}/?tkn=${ws.uid}&folder=/workspace/${ws.name}`,
-            '_blank',
-          )
+          window.open(vscodeUrl(window.location.hostname, ws.port, ws.uid, ws.name), '_blank')
         }
       }
       return
@@ -278,12 +441,47 @@ function WorkspacesPage() {
       }
     }
 
-    // Map to bulk or single action
-    const bulkTargets = targets.map((w) => ({
-      name: w.name,
-      pod: w.pod,
-      uid: w.uid,
-    }))
+    // Several starts or stops go out as one /api/bulk request instead of one
+    // /api/workspaces round trip per workspace. Bulk delete is not used:
+    // unlike the single delete it leaves the saved-spec and meta configmaps.
+    if ((action === 'start' || action === 'stop') && targets.length > 1) {
+      const taskIds = targets.map((ws) => addTask(action, ws.name))
+      try {
+        const res = await apiPost('/api/bulk', {
+          action,
+          workspaces: targets.map((w) => ({
+            name: w.name,
+            pod: w.pod,
+            uid: w.uid,
+          })),
+        })
+        const data = (await res.json()) as {
+          message?: string
+          results?: { name: string; ok: boolean; message: string }[]
+        }
+        const results = new Map((data.results ?? []).map((r) => [r.name, r]))
+        targets.forEach((ws, i) => {
+          const result = results.get(ws.name)
+          const ok = result ? result.ok : res.ok
+          updateTask(
+            taskIds[i],
+            ok
+              ? { status: 'completed' }
+              : { status: 'failed', error: result?.message ?? data.message },
+          )
+        })
+      } catch (err) {
+        for (const taskId of taskIds) {
+          updateTask(taskId, {
+            status: 'failed',
+            error: err instanceof Error ? err.message : 'Unknown error',
+          })
+        }
+      }
+      setSelected(new Set())
+      window.location.reload()
+      return
+    }
 
     for (const ws of targets) {
       const taskId = addTask(
@@ -291,53 +489,23 @@ function WorkspacesPage() {
         ws.name,
       )
       try {
-        if (['start', 'stop', 'delete'].includes(action)) {
-          await fetch('/api/workspaces', {
-            method: 'POST',
-            headers: {
-              'Content-Type': 'application/json',
-              'X-Requested-With': 'workspacekit',
-            },
-            body: JSON.stringify({
-              action,
-              name: ws.name,
-              pod: ws.pod,
-              uid: ws.uid,
-              repo: ws.repo,
-              owner: ws.owner,
-            }),
-          })
-        } else if (action === 'rebuild') {
-          await fetch('/api/workspaces', {
-            method: 'POST',
-            headers: {
-              'Content-Type': 'application/json',
-              'X-Requested-With': 'workspacekit',
-            },
-            body: JSON.stringify({
-              action: 'rebuild',
-              name: ws.name,
-              pod: ws.pod,
-              uid: ws.uid,
-              repo: ws.repo,
-              owner: ws.owner,
-            }),
+        if (['start', 'stop', 'delete', 'rebuild'].includes(action)) {
+          await apiPost('/api/workspaces', {
+            action,
+            name: ws.name,
+            pod: ws.pod,
+            uid: ws.uid,
+            repo: ws.repo,
+            owner: ws.owner,
           })
         } else if (action === 'duplicate') {
-          await fetch('/api/workspaces', {
-            method: 'POST',
-            headers: {
-              'Content-Type': 'application/json',
-              'X-Requested-With': 'workspacekit',
-            },
-            body: JSON.stringify({
-              action: 'duplicate',
-              source_pod: ws.pod,
-              source_name: ws.name,
-              source_uid: ws.uid,
-              new_name: `${ws.name}-copy`,
-              repo: ws.repo,
-            }),
+          await apiPost('/api/workspaces', {
+            action: 'duplicate',
+            source_pod: ws.pod,
+            source_name: ws.name,
+            source_uid: ws.uid,
+            new_name: `${ws.name}-copy`,
+            repo: ws.repo,
           })
         }
         updateTask(taskId, { status: 'completed' })
@@ -350,7 +518,7 @@ function WorkspacesPage() {
     }
     setSelected(new Set())
     window.location.reload()
-  }
+  }, [])
 
   // --- Sort toggle ---
   const toggleSort = (col: SortCol) => {
@@ -361,24 +529,30 @@ function WorkspacesPage() {
     )
   }
 
-  // --- Context menu actions ---
-  const contextAction = (action: string, ws: Workspace) => {
-    fireAction(action, [ws])
-  }
+  // --- Row / card actions ---
+  // Buttons and menu items are tagged with data-action + data-ws instead of
+  // each holding its own closure. One handler per view resolves the target;
+  // React events bubble through the context-menu portal, so menu items are
+  // covered too.
+  const workspacesByName = useMemo(
+    () => new Map(workspaces.map((ws) => [ws.name, ws])),
+    [workspaces],
+  )
 
-  function SortHeader({ col, label }: { col: SortCol; label: string }) {
-    return (
-      <TableHead
-        className="cursor-pointer select-none hover:text-foreground"
-        onClick={() => toggleSort(col)}
-      >
-        <span className="flex items-center gap-1">
-          {label}
-          <ArrowUpDown className="h-3 w-3" />
-        </span>
-      </TableHead>
-    )
-  }
+  const handleActionClick = useCallback(
+    (e: React.MouseEvent) => {
+      const target = (e.target as Element).closest<HTMLElement>('[data-action]')
+      const ws = target && workspacesByName.get(target.dataset.ws ?? '')
+      if (!target || !ws) return
+      const action = target.dataset.action ?? ''
+      if (action === 'details') {
+        window.location.href = `/workspace/${ws.uid}`
+        return
+      }
+      fireAction(action, [ws])
+    },
+    [workspacesByName, fireAction],
+  )
 
   return (
     <div className="flex flex-col gap-4">
@@ -398,7 +572,10 @@ function WorkspacesPage() {
 
       {/* Table view */}
       {viewMode === 'table' && (
-        <div className="rounded-md border border-border bg-card shadow-[var(--shadow-card)]">
+        <div
+          className="rounded-md border border-border bg-card shadow-[var(--shadow-card)]"
+          onClick={handleActionClick}
+        >
           <Table>
             <TableHeader>
               <TableRow>
@@ -407,17 +584,17 @@ function WorkspacesPage() {
                     type="checkbox"
                     checked={selected.size === workspaces.length && workspaces.length > 0}
                     onChange={toggleAll}
-                    className="h-3.5 w-3.5 rounded border-border accent-primary"
+                    className={CHECKBOX_CLASS}
                   />
                 </TableHead>
-                <SortHeader col="status" label="Status" />
-                <SortHeader col="name" label="Name" />
-                <SortHeader col="cpu" label="CPU" />
-                <SortHeader col="memory" label="Memory" />
-                <SortHeader col="owner" label="Owner" />
-                <SortHeader col="repo" label="Repository" />
-                <SortHeader col="branch" label="Branch" />
-                <SortHeader col="age" label="Age" />
+                <SortHeader col="status" label="Status" onSort={toggleSort} />
+                <SortHeader col="name" label="Name" onSort={toggleSort} />
+                <SortHeader col="cpu" label="CPU" onSort={toggleSort} />
+                <SortHeader col="memory" label="Memory" onSort={toggleSort} />
+                <SortHeader col="owner" label="Owner" onSort={toggleSort} />
+                <SortHeader col="repo" label="Repository" onSort={toggleSort} />
+                <SortHeader col="branch" label="Branch" onSort={toggleSort} />
+                <SortHeader col="age" label="Age" onSort={toggleSort} />
               </TableRow>
             </TableHeader>
             <TableBody>
@@ -431,108 +608,12 @@ function WorkspacesPage() {
                 </TableRow>
               ) : (
                 filteredList.map((ws) => (
-                  <ContextMenu key={ws.name}>
-                    <ContextMenuTrigger asChild>
-                      <TableRow
-                        className={cn(
-                          'cursor-default',
-                          selected.has(ws.name) && 'bg-accent/50',
-                        )}
-                      >
-                        <TableCell>
-                          <input
-                            type="checkbox"
-                            checked={selected.has(ws.name)}
-                            onChange={() => toggleSelect(ws.name)}
-                            className="h-3.5 w-3.5 rounded border-border accent-primary"
-                          />
-                        </TableCell>
-                        <TableCell>
-                          <span className="flex items-center gap-2">
-                            <StatusDot ws={ws} />
-                            <span className="text-xs">{statusLabel(ws)}</span>
-                          </span>
-                        </TableCell>
-                        <TableCell>
-                          <Link
-                            to="/workspace/$uid"
-                            params={{ uid: ws.uid }}
-                            className="font-medium text-primary hover:underline"
-                          >
-                            {ws.name}
-                          </Link>
-                        </TableCell>
-                        <TableCell className="tabular-nums text-xs">
-                          {ws.usage?.cpu ?? '-'}
-                        </TableCell>
-                        <TableCell className="tabular-nums text-xs">
-                          {ws.usage?.memory ?? '-'}
-                        </TableCell>
-                        <TableCell className="text-xs text-muted-foreground">
-                          {ws.owner || '-'}
-                        </TableCell>
-                        <TableCell className="text-xs text-muted-foreground max-w-40 truncate">
-                          {ws.repo
-                            ? ws.repo
-                                .replace(/^https?:\/\/(github\.com\/)?/, '')
-                                .replace(/\.git$/, '')
-                            : '-'}
-                        </TableCell>
-                        <TableCell className="text-xs text-muted-foreground">
-                          {ws.branch || '-'}
-                        </TableCell>
-                        <TableCell className="text-xs text-muted-foreground tabular-nums">
-                          {ws.last_accessed || '-'}
-                        </TableCell>
-                      </TableRow>
-                    </ContextMenuTrigger>
-                    <ContextMenuContent>
-                      {ws.running && ws.port > 0 && (
-                        <ContextMenuItem
-                          onClick={() => contextAction('open-vscode', ws)}
-                        >
-                          <ExternalLink className="h-3.5 w-3.5" />
-                          Open VSCode
-                        </ContextMenuItem>
-                      )}
-                      {!ws.running && !ws.creating && (
-                        <ContextMenuItem
-                          onClick={() => contextAction('start', ws)}
-                        >
-                          <Play className="h-3.5 w-3.5 text-success" />
-                          Start
-                        </ContextMenuItem>
-                      )}
-                      {ws.running && (
-                        <ContextMenuItem
-                          onClick={() => contextAction('stop', ws)}
-                        >
-                          <Square className="h-3.5 w-3.5 text-warning" />
-                          Stop
-                        </ContextMenuItem>
-                      )}
-                      <ContextMenuItem
-                        onClick={() => contextAction('rebuild', ws)}
-                      >
-                        <RotateCcw className="h-3.5 w-3.5" />
-                        Rebuild
-                      </ContextMenuItem>
-                      <ContextMenuItem
-                        onClick={() => contextAction('duplicate', ws)}
-                      >
-                        <Copy className="h-3.5 w-3.5" />
-                        Duplicate
-                      </ContextMenuItem>
-                      <ContextMenuSeparator />
-                      <ContextMenuItem
-                        variant="destructive"
-                        onClick={() => contextAction('delete', ws)}
-                      >
-                        <Trash2 className="h-3.5 w-3.5" />
-                        Delete
-                      </ContextMenuItem>
-                    </ContextMenuContent>
-                  </ContextMenu>
+                  <WorkspaceTableRow
+                    key={ws.name}
+                    ws={ws}
+                    selected={selected.has(ws.name)}
+                    onToggle={toggleSelect}
+                  />
                 ))
               )}
             </TableBody>
@@ -542,7 +623,7 @@ function WorkspacesPage() {
 
       {/* Card view */}
       {viewMode === 'cards' && (
-        <div className="grid grid-cols-1 gap-4 xl:grid-cols-2">
+        <div className="grid grid-cols-1 gap-4 xl:grid-cols-2" onClick={handleActionClick}>
           {filteredList.length === 0 ? (
             <Card className="col-span-full border-border bg-card shadow-[var(--shadow-card)]">
               <CardContent className="py-12 text-center">
@@ -555,176 +636,191 @@ function WorkspacesPage() {
               </CardContent>
             </Card>
           ) : (
-            filteredList.map((ws) => (
-              <ContextMenu key={ws.name}>
-                <ContextMenuTrigger asChild>
-                  <Card
-                    className={cn(
-                      'border-border bg-card shadow-[var(--shadow-card)] transition-shadow hover:shadow-[var(--shadow-panel)]',
-                      selected.has(ws.name) && 'ring-2 ring-primary/30',
-                    )}
-                  >
-                    <CardHeader className="pb-3">
-                      <div className="flex items-center justify-between">
-                        <div className="flex items-center gap-3">
-                          <input
-                            type="checkbox"
-                            checked={selected.has(ws.name)}
-                            onChange={() => toggleSelect(ws.name)}
-                            className="h-3.5 w-3.5 rounded border-border accent-primary"
-                          />
-                          <Link
-                            to="/workspace/$uid"
-                            params={{ uid: ws.uid }}
-                            className="text-sm font-semibold text-foreground hover:text-primary hover:no-underline"
-                          >
-                            {ws.name}
-                          </Link>
-                          <Badge
-                            variant={
-                              statusColor(ws) as
-                                | 'default'
-                                | 'secondary'
-                                | 'destructive'
-                            }
-                          >
-                            {statusLabel(ws)}
-                          </Badge>
+            filteredList.map((ws) => {
+              const status = workspaceStatus(ws)
+              return (
+                <ContextMenu key={ws.name}>
+                  <ContextMenuTrigger asChild>
+                    <Card
+                      className={cn(
+                        'border-border bg-card shadow-[var(--shadow-card)] transition-shadow hover:shadow-[var(--shadow-panel)]',
+                        selected.has(ws.name) && 'ring-2 ring-primary/30',
+                      )}
+                    >
+                      <CardHeader className="pb-3">
+                        <div className="flex items-center justify-between">
+                          <div className="flex items-center gap-3">
+                            <input
+                              type="checkbox"
+                              checked={selected.has(ws.name)}
+                              onChange={() => toggleSelect(ws.name)}
+                              className={CHECKBOX_CLASS}
+                            />
+                            <Link
+                              to="/workspace/$uid"
+                              params={{ uid: ws.uid }}
+                              className="text-sm font-semibold text-foreground hover:text-primary hover:no-underline"
+                            >
+                              {ws.name}
+                            </Link>
+                            <Badge
+                              variant={
+                                status.variant as
+                                  | 'default'
+                                  | 'secondary'
+                                  | 'destructive'
+                              }
+                            >
+                              {status.label}
+                            </Badge>
+                          </div>
                         </div>
-                      </div>
-                    </CardHeader>
-                    <CardContent className="flex flex-col gap-2">
-                      <div className="flex flex-wrap items-center gap-x-4 gap-y-1 text-xs text-muted-foreground">
-                        {ws.repo && (
-                          <span className="flex items-center gap-1">
-                            <GitBranch className="h-3 w-3" />
-                            {ws.repo
-                              .replace(/^https?:\/\/(github\.com\/)?/, '')
-                              .replace(/\.git$/, '')}
-                            {ws.branch && (
-                              <span className="text-foreground/60">
-                                :{ws.branch}
-                              </span>
-                            )}
-                          </span>
-                        )}
-                        {ws.owner && (
-                          <span className="flex items-center gap-1">
-                            <User className="h-3 w-3" />
-                            {ws.owner}
-                          </span>
-                        )}
-                      </div>
-                      <div className="flex flex-wrap items-center gap-x-4 gap-y-1 text-xs text-muted-foreground">
-                        {ws.resources && (
-                          <>
-                            <span>
-                              CPU: {ws.resources.req_cpu || '-'}/
-                              {ws.resources.lim_cpu || '-'}
-                            </span>
-                            <span>
-                              Mem: {ws.resources.req_mem || '-'}/
-                              {ws.resources.lim_mem || '-'}
+                      </CardHeader>
+                      <CardContent className="flex flex-col gap-2">
+                        <div className="flex flex-wrap items-center gap-x-4 gap-y-1 text-xs text-muted-foreground">
+                          {ws.repo && (
+                            <span className="flex items-center gap-1">
+                              <GitBranch className="h-3 w-3" />
+                              {shortRepo(ws.repo)}
+                              {ws.branch && (
+                                <span className="text-foreground/60">
+                                  :{ws.branch}
+                                </span>
+                              )}
                             </span>
-                          </>
-                        )}
-                        {ws.usage && (
-                          <>
-                            <span className="text-foreground/60">|</span>
-                            <span>
-                              Usage: {ws.usage.cpu} CPU, {ws.usage.memory} Mem
+                          )}
+                          {ws.owner && (
+                            <span className="flex items-center gap-1">
+                              <User className="h-3 w-3" />
+                              {ws.owner}
                             </span>
-                          </>
-                        )}
-                      </div>
-                      {/* Card-level actions */}
-                      <div className="flex flex-wrap gap-1.5 pt-1">
-                        {ws.running && ws.port > 0 && (
-                          <Button
-                            size="xs"
-                            onClick={() => contextAction('open-vscode', ws)}
-                          >
-                            <ExternalLink className="h-3 w-3" />
-                            Open
-                          </Button>
-                        )}
-                        {!ws.running && !ws.creating && (
-                          <Button
-                            variant="outline"
-                            size="xs"
-                            onClick={() => contextAction('start', ws)}
-                            className="text-success border-success/30 hover:bg-success/10"
-                          >
-                            <Play className="h-3 w-3" />
-                            Start
-                          </Button>
-                        )}
-                        {ws.running && (
+                          )}
+                        </div>
+                        <div className="flex flex-wrap items-center gap-x-4 gap-y-1 text-xs text-muted-foreground">
+                          {ws.resources && (
+                            <>
+                              <span>
+                                CPU: {ws.resources.req_cpu || '-'}/
+                                {ws.resources.lim_cpu || '-'}
+                              </span>
+                              <span>
+                                Mem: {ws.resources.req_mem || '-'}/
+                                {ws.resources.lim_mem || '-'}
+                              </span>
+                            </>
+                          )}
+                          {ws.usage && (
+                            <>
+                              <span className="text-foreground/60">|</span>
+                              <span>
+                                Usage: {ws.usage.cpu} CPU, {ws.usage.memory} Mem
+                              </span>
+                            </>
+                          )}
+                        </div>
+                        {/* Card-level actions */}
+                        <div className="flex flex-wrap gap-1.5 pt-1">
+                          {ws.running && ws.port > 0 && (
+                            <Button
+                              size="xs"
+                              data-action="open-vscode"
+                              data-ws={ws.name}
+                            >
+                              <ExternalLink className="h-3 w-3" />
+                              Open
+                            </Button>
+                          )}
+                          {!ws.running && !ws.creating && (
+                            <Button
+                              variant="outline"
+                              size="xs"
+                              data-action="start"
+                              data-ws={ws.name}
+                              className="text-success border-success/30 hover:bg-success/10"
+                            >
+                              <Play className="h-3 w-3" />
+                              Start
+                            </Button>
+                          )}
+                          {ws.running && (
+                            <Button
+                              variant="outline"
+                              size="xs"
+                              data-action="stop"
+                              data-ws={ws.name}
+                              className="text-warning border-warning/30 hover:bg-warning/10"
+                            >
+                              <Square className="h-3 w-3" />
+                              Stop
+                            </Button>
+                          )}
                           <Button
                             variant="outline"
                             size="xs"
-                            onClick={() => contextAction('stop', ws)}
-                            className="text-warning border-warning/30 hover:bg-warning/10"
+                            data-action="details"
+                            data-ws={ws.name}
                           >
-                            <Square className="h-3 w-3" />
-                            Stop
+                            Details
                           </Button>
-                        )}
-                        <Button
-                          variant="outline"
-                          size="xs"
-                          onClick={() =>
-                            (window.location.href = `/workspace/${ws.uid}`)
-                          }
-                        >
-                          Details
-                        </Button>
-                      </div>
-                    </CardContent>
-                  </Card>
-                </ContextMenuTrigger>
-                <ContextMenuContent>
-                  {ws.running && ws.port > 0 && (
+                        </div>
+                      </CardContent>
+                    </Card>
+                  </ContextMenuTrigger>
+                  <ContextMenuContent>
+                    {ws.running && ws.port > 0 && (
+                      <ContextMenuItem
+                        data-action="open-vscode"
+                        data-ws={ws.name}
+                      >
+                        <ExternalLink className="h-3.5 w-3.5" />
+                        Open VSCode
+                      </ContextMenuItem>
+                    )}
+                    {!ws.running && !ws.creating && (
+                      <ContextMenuItem
+                        data-action="start"
+                        data-ws={ws.name}
+                      >
+                        <Play className="h-3.5 w-3.5 text-success" />
+                        Start
+                      </ContextMenuItem>
+                    )}
+                    {ws.running && (
+                      <ContextMenuItem
+                        data-action="stop"
+                        data-ws={ws.name}
+                      >
+                        <Square className="h-3.5 w-3.5 text-warning" />
+                        Stop
+                      </ContextMenuItem>
+                    )}
                     <ContextMenuItem
-                      onClick={() => contextAction('open-vscode', ws)}
+                      data-action="rebuild"
+                      data-ws={ws.name}
                     >
-                      <ExternalLink className="h-3.5 w-3.5" />
-                      Open VSCode
+                      <RotateCcw className="h-3.5 w-3.5" />
+                      Rebuild
                     </ContextMenuItem>
-                  )}
-                  {!ws.running && !ws.creating && (
-                    <ContextMenuItem onClick={() => contextAction('start', ws)}>
-                      <Play className="h-3.5 w-3.5 text-success" />
-                      Start
+                    <ContextMenuItem
+                      data-action="duplicate"
+                      data-ws={ws.name}
+                    >
+                      <Copy className="h-3.5 w-3.5" />
+                      Duplicate
                     </ContextMenuItem>
-                  )}
-                  {ws.running && (
-                    <ContextMenuItem onClick={() => contextAction('stop', ws)}>
-                      <Square className="h-3.5 w-3.5 text-warning" />
-                      Stop
+                    <ContextMenuSeparator />
+                    <ContextMenuItem
+                      variant="destructive"
+                      data-action="delete"
+                      data-ws={ws.name}
+                    >
+                      <Trash2 className="h-3.5 w-3.5" />
+                      Delete
                     </ContextMenuItem>
-                  )}
-                  <ContextMenuItem onClick={() => contextAction('rebuild', ws)}>
-                    <RotateCcw className="h-3.5 w-3.5" />
-                    Rebuild
-                  </ContextMenuItem>
-                  <ContextMenuItem
-                    onClick={() => contextAction('duplicate', ws)}
-                  >
-                    <Copy className="h-3.5 w-3.5" />
-                    Duplicate
-                  </ContextMenuItem>
-                  <ContextMenuSeparator />
-                  <ContextMenuItem
-                    variant="destructive"
-                    onClick={() => contextAction('delete', ws)}
-                  >
-                    <Trash2 className="h-3.5 w-3.5" />
-                    Delete
-                  </ContextMenuItem>
-                </ContextMenuContent>
-              </ContextMenu>
-            ))
+                  </ContextMenuContent>
+                </ContextMenu>
+              )
+            })
           )}
         </div>
       )}
@@ -37,6 +37,8 @@ const STEP_DEFINITIONS: Array<{ id: CreationStepId; label: string }> = [
 
 interface LogEntry {
   lines: string[]
+  /** Total lines ever appended; unlike lines.length it keeps growing after trims. */
+  appended: number
   steps: CreationStep[]
   status: 'creating' | 'completed' | 'error'
   createdAt: number
@@ -77,6 +79,7 @@ if (typeof cleanupTimer === 'object' && 'unref' in cleanupTimer) {
 export function initCreationLog(uid: string): void {
   logStore.set(uid, {
     lines: [],
+    appended: 0,
     steps: STEP_DEFINITIONS.map((s) => ({ ...s, status: 'pending' as CreationStepStatus })),
     status: 'creating',
     createdAt: Date.now(),
@@ -111,6 +114,7 @@ export function appendCreationLog(uid: string, line: string): void {
   if (!entry) {
     entry = {
       lines: [],
+      appended: 0,
       steps: STEP_DEFINITIONS.map((s) => ({ ...s, status: 'pending' as CreationStepStatus })),
       status: 'creating',
       createdAt: Date.now(),
@@ -119,6 +123,7 @@ export function appendCreationLog(uid: string, line: string): void {
   }
 
   entry.lines.push(line)
+  entry.appended++
 
   // Trim from the front if we exceed the limit
   if (entry.lines.length > MAX_LINES) {
@@ -133,6 +138,25 @@ export function getCreationLog(uid: string): string[] {
   return logStore.get(uid)?.lines ?? []
 }
 
+/**
+ * Returns the lines appended since `cursor` (a previous return value's
+ * cursor, or 0) together with the new cursor. Lines already trimmed from
+ * the buffer are skipped, so a reader never stalls once the buffer is full.
+ */
+export function getCreationLogSince(
+  uid: string,
+  cursor: number,
+): { lines: string[]; cursor: number } {
+  const entry = logStore.get(uid)
+  if (!entry) return { lines: [], cursor }
+  const fresh = entry.appended - cursor
+  if (fresh <= 0) return { lines: [], cursor: entry.appended }
+  return {
+    lines: entry.lines.slice(Math.max(0, entry.lines.length - fresh)),
+    cursor: entry.appended,
+  }
+}
+
 /**
  * Removes the log entry for the given workspace.
  */
@@ -10,6 +10,7 @@
 import os from 'node:os'
 import fs from 'node:fs'
 import { execSync } from 'node:child_process'
+import { gzipSync } from 'node:zlib'
 import {
   getPodMetrics,
   parseCpuValue,
@@ -51,9 +52,30 @@ let podMetricsCache = new Map<string, PodMetric>()
 const usageHistoryCache = new Map<string, UsageEntry[]>()
 
 /**
- * Cached system stats snapshot returned by getStats().
+ * Latest system stats snapshot returned by getStats(). Collectors never
+ * mutate it; they build a new frozen object and swap it in via
+ * publishStats(), so readers hold a consistent sample without copying.
  */
-export let statsCache: SystemStats = emptyStats()
+let statsCache: SystemStats = emptyStats()
+
+/**
+ * JSON encoding of statsCache, serialized when a snapshot is published and
+ * shared by every /api/stats poll until the next one.
+ */
+let statsJson: string | null = null
+
+/** UTF-8 bytes and gzip of statsJson, built lazily alongside it. */
+let statsBytes: Uint8Array | null = null
+let statsGzip: Uint8Array | null = null
+
+/**
+ * Identifies the current snapshot for conditional GETs: a per-process epoch
+ * plus a counter bumped whenever a publish changes the serialized snapshot,
+ * so values never repeat across restarts and an unchanged sample keeps its
+ * ETag.
+ */
+const STATS_EPOCH = Date.now().toString(36)
+let statsVersion = 0
 
 /**
  * Previous CPU times snapshot for delta-based CPU% calculation.
@@ -78,6 +100,34 @@ function emptyStats(): SystemStats {
   }
 }
 
+// ---------------------------------------------------------------------------
+// Snapshot publishing
+// ---------------------------------------------------------------------------
+
+/**
+ * Freezes a freshly built sample (and the nested objects readers see) and
+ * makes it the current snapshot. The previous snapshot is left untouched
+ * for anyone still holding it. A sample that serializes identically to the
+ * current one keeps its ETag and encodings, so pollers get a 304.
+ */
+function publishStats(next: SystemStats): void {
+  const previousJson = getStatsJson()
+  const json = JSON.stringify(next)
+  Object.freeze(next.cpu)
+  Object.freeze(next.mem)
+  Object.freeze(next.swap)
+  Object.freeze(next.load)
+  Object.freeze(next.disk)
+  for (const proc of next.procs) Object.freeze(proc)
+  Object.freeze(next.procs)
+  statsCache = Object.freeze(next)
+  if (json === previousJson) return
+  statsJson = json
+  statsBytes = null
+  statsGzip = null
+  statsVersion++
+}
+
 // ---------------------------------------------------------------------------
 // System stats collectors
 // ---------------------------------------------------------------------------
@@ -210,6 +260,14 @@ function collectDisk(): { total: number; used: number; available: number } {
   }
 }
 
+/**
+ * One `ps aux` row: USER PID %CPU %MEM VSZ RSS TTY STAT START TIME COMMAND.
+ * Captures the fields we keep in a single pass; COMMAND is the untouched
+ * remainder of the line.
+ */
+const PS_LINE_RE =
+  /^(\S+)\s+(\S+)\s+(\S+)\s+(\S+)\s+\S+\s+(\S+)\s+\S+\s+\S+\s+\S+\s+\S+\s+(.+)$/
+
 /**
  * Runs `ps aux --sort=-rss | head -21` to get top processes by memory.
  */
@@ -229,17 +287,18 @@ function collectProcesses(): ProcessInfo[] {
 
     // Skip header line (first line from `ps aux` output)
     for (let i = 1; i < lines.length && procs.length < 20; i++) {
-      const parts = lines[i].split(/\s+/)
-      if (parts.length < 11) continue
+      const m = PS_LINE_RE.exec(lines[i])
+      if (!m) continue
 
-      const rssKb = parseInt(parts[5], 10)
+      const [, user, pid, cpu, mem, rss, cmd] = m
+      const rssKb = parseInt(rss, 10)
       procs.push({
-        pid: parts[1],
-        user: parts[0],
-        cpu: parts[2],
-        mem: parts[3],
+        pid,
+        user,
+        cpu,
+        mem,
         rss: isNaN(rssKb) ? 0 : rssKb * 1024,
-        cmd: parts.slice(10).join(' '),
+        cmd,
       })
     }
 
@@ -266,7 +325,7 @@ function collectSystemStats(): void {
     const cpuMap = { ...statsCache.cpu }
     cpuMap['_system'] = cpuPercent
 
-    statsCache = {
+    publishStats({
       ...statsCache,
       cpu: cpuMap,
       ncpu: os.cpus().length,
@@ -276,7 +335,7 @@ function collectSystemStats(): void {
       uptime: formatUptime(uptimeSeconds),
       disk,
       procs,
-    }
+    })
   } catch (err) {
     console.error('[stats] Failed to collect system stats:', err)
   }
@@ -325,11 +384,11 @@ async function collectPodMetrics(): Promise<void> {
     }
     Object.assign(mergedCpu, podCpuMap)
 
-    statsCache = {
+    publishStats({
       ...statsCache,
       cpu: mergedCpu,
       tasks: String(pods.length),
-    }
+    })
   } catch (err) {
     console.error('[stats] Failed to collect pod metrics:', err)
   }
@@ -435,18 +494,84 @@ export function startStatsCollection(): void {
   }
 }
 
+/** Exposed for testing: publishes a snapshot the way the collectors do. */
+export function _publishStats(next: SystemStats): void {
+  publishStats(next)
+}
+
 /**
- * Returns the most recent cached system stats.
+ * Returns the most recent system stats snapshot. The object is frozen;
+ * callers may hold on to it but must not modify it.
  */
 export function getStats(): SystemStats {
   return statsCache
 }
 
 /**
- * Returns the cached usage history for a specific pod.
+ * Returns the ETag of the most recent system stats snapshot.
  */
-export function getUsageHistory(podName: string): UsageEntry[] {
-  return usageHistoryCache.get(podName) ?? []
+export function getStatsEtag(): string {
+  return `"${STATS_EPOCH}-${statsVersion}"`
+}
+
+/**
+ * Returns the most recent system stats snapshot as a JSON string.
+ */
+export function getStatsJson(): string {
+  if (statsJson === null) statsJson = JSON.stringify(statsCache)
+  return statsJson
+}
+
+/**
+ * Returns the most recent system stats snapshot as UTF-8 encoded JSON, so
+ * responses reuse one buffer instead of encoding the string per request.
+ */
+export function getStatsBytes(): Uint8Array {
+  if (statsBytes === null) statsBytes = new TextEncoder().encode(getStatsJson())
+  return statsBytes
+}
+
+/**
+ * Returns the most recent system stats snapshot as gzipped JSON. The
+ * snapshot is compressed once and the bytes shared by every poll that
+ * accepts gzip.
+ */
+export function getStatsGzip(): Uint8Array {
+  if (statsGzip === null) statsGzip = gzipSync(getStatsBytes())
+  return statsGzip
+}
+
+/**
+ * Returns the cached usage history for a specific pod. When `buckets` is
+ * given and the history is longer, it is downsampled to that many points.
+ */
+export function getUsageHistory(podName: string, buckets?: number): UsageEntry[] {
+  const history = usageHistoryCache.get(podName) ?? []
+  return buckets ? downsampleUsage(history, buckets) : history
+}
+
+/**
+ * Reduces `entries` to at most `buckets` points by splitting them into
+ * consecutive, evenly sized buckets. Each bucket keeps its last timestamp
+ * and its peak CPU / memory, so short spikes stay visible on a sparkline.
+ */
+export function downsampleUsage(entries: UsageEntry[], buckets: number): UsageEntry[] {
+  const n = entries.length
+  if (buckets < 1 || n <= buckets) return entries
+
+  const out = new Array<UsageEntry>(buckets)
+  for (let b = 0; b < buckets; b++) {
+    const start = Math.floor((b * n) / buckets)
+    const end = Math.floor(((b + 1) * n) / buckets)
+    let cpu = 0
+    let mem = 0
+    for (let i = start; i < end; i++) {
+      if (entries[i].cpu_mc > cpu) cpu = entries[i].cpu_mc
+      if (entries[i].mem_bytes > mem) mem = entries[i].mem_bytes
+    }
+    out[b] = { timestamp: entries[end - 1].timestamp, cpu_mc: cpu, mem_bytes: mem }
+  }
+  return out
 }
 
 /**
@@ -31,6 +31,7 @@ import {
   deleteConfigMap,
   savePodSpec,
   getSavedPodSpec,
+  getSavedSpecConfigMap,
   saveWorkspaceMeta,
   getWorkspaceMeta,
   getWorkspaceDefaults,
@@ -54,6 +55,7 @@ import type {
   WorkspaceDetail,
   ApiResponse,
   Resources,
+  Pvc,
 } from '@workspacekit/types'
 import { config } from '~/lib/config'
 import { generateUid, repoToName, sanitizeName } from '~/lib/utils'
@@ -136,6 +138,27 @@ async function fetchDevcontainerConfig(
   }
 }
 
+/**
+ * The `wsk/*` annotation fields shared by list items and detail views, read
+ * from a pod's (or saved spec's) annotations in one place.
+ */
+function annotationFields(
+  annotations: Record<string, string>,
+): Pick<
+  WorkspaceDetail,
+  'repo' | 'branch' | 'dirty' | 'last_commit' | 'owner' | 'last_accessed' | 'expiry_warning'
+> {
+  return {
+    repo: annotations['wsk/repo'] ?? '',
+    branch: annotations['wsk/branch'] ?? '',
+    dirty: annotations['wsk/dirty'] === 'true',
+    last_commit: annotations['wsk/last-commit'] ?? '',
+    owner: annotations['wsk/owner'] ?? '',
+    last_accessed: annotations['wsk/last-accessed'] ?? '',
+    expiry_warning: annotations['wsk/expiry-warning'] ?? '',
+  }
+}
+
 /**
  * Builds a Workspace list item from a running pod.
  */
@@ -163,14 +186,8 @@ function podToWorkspace(
     shutdown_at: annotations['wsk/shutdown-at'] ?? '',
     shutdown_hours: annotations['wsk/shutdown-hours'] ?? '',
     resources,
-    repo: annotations['wsk/repo'] ?? '',
-    branch: annotations['wsk/branch'] ?? '',
-    dirty: annotations['wsk/dirty'] === 'true',
-    last_commit: annotations['wsk/last-commit'] ?? '',
+    ...annotationFields(annotations),
     usage: metric ? { cpu: metric.cpu, memory: metric.memory } : undefined,
-    owner: annotations['wsk/owner'] ?? '',
-    last_accessed: annotations['wsk/last-accessed'] ?? '',
-    expiry_warning: annotations['wsk/expiry-warning'] ?? '',
   }
 }
 
@@ -208,20 +225,35 @@ function savedSpecToWorkspace(
       shutdown_at: '',
       shutdown_hours: '',
       resources,
-      repo: annotations['wsk/repo'] ?? '',
-      branch: annotations['wsk/branch'] ?? '',
-      dirty: annotations['wsk/dirty'] === 'true',
-      last_commit: annotations['wsk/last-commit'] ?? '',
+      ...annotationFields(annotations),
       usage: undefined,
-      owner: annotations['wsk/owner'] ?? '',
-      last_accessed: annotations['wsk/last-accessed'] ?? '',
-      expiry_warning: annotations['wsk/expiry-warning'] ?? '',
     }
   } catch {
     return null
   }
 }
 
+/**
+ * Picks the PVCs belonging to workspace `uid` and maps them to the detail
+ * view's shape in a single pass.
+ */
+function workspacePvcs(
+  pvcs: import('@kubernetes/client-node').V1PersistentVolumeClaim[],
+  uid: string,
+): Pvc[] {
+  const out: Pvc[] = []
+  for (const pvc of pvcs) {
+    if (pvc.metadata?.labels?.['workspace-uid'] !== uid) continue
+    out.push({
+      name: pvc.metadata?.name ?? '',
+      capacity: pvc.status?.capacity?.['storage'] ?? '',
+      status: pvc.status?.phase ?? '',
+      storage_class: pvc.spec?.storageClassName ?? '',
+    })
+  }
+  return out
+}
+
 // ---------------------------------------------------------------------------
 // Server functions
 // ---------------------------------------------------------------------------
@@ -239,12 +271,18 @@ export const getWorkspaces = createServerFn({ method: 'GET' }).handler(
       listConfigMaps('managed-by=workspacekit,component=saved-spec'),
     ])
 
-    // Build service NodePort lookup by workspace UID
+    // Fresh install / everything deleted: nothing to assemble.
+    if (pods.length === 0 && savedCms.length === 0) return []
+
+    // Build service NodePort lookup by workspace UID. Only running pods
+    // have a port, so skip the walk when nothing is running.
     const serviceMap = new Map<string, number>()
-    for (const svc of services) {
-      const uid = svc.metadata?.labels?.['workspace-uid'] ?? ''
-      if (uid) {
-        serviceMap.set(uid, getNodePort(svc))
+    if (pods.length > 0) {
+      for (const svc of services) {
+        const uid = svc.metadata?.labels?.['workspace-uid'] ?? ''
+        if (uid) {
+          serviceMap.set(uid, getNodePort(svc))
+        }
       }
     }
 
@@ -283,9 +321,18 @@ export const getWorkspaceDetail = createServerFn({ method: 'GET' })
 
     const { uid } = data
 
-    // Try to find a running pod for this workspace
-    const pods = await listWorkspacePods()
-    const pod = pods.find((p) => getWorkspaceUid(p) === uid)
+    // Workspace pods are named ws-<uid>, so the common cases resolve with
+    // point reads: the pod itself when running, the saved spec when stopped.
+    // Only a pod under some other name needs the full pod list.
+    const [namedPod, savedCm] = await Promise.all([
+      getPod(`ws-${uid}`),
+      getSavedSpecConfigMap(uid),
+    ])
+    let pod = namedPod && getWorkspaceUid(namedPod) === uid ? namedPod : undefined
+    if (!pod && !savedCm) {
+      const pods = await listWorkspacePods()
+      pod = pods.find((p) => getWorkspaceUid(p) === uid)
+    }
 
     if (pod) {
       const podName = pod.metadata?.name ?? ''
@@ -307,19 +354,13 @@ export const getWorkspaceDetail = createServerFn({ method: 'GET' })
       )
       const port = svc ? getNodePort(svc) : 0
 
-      const wsPvcs = pvcs
-        .filter((pvc) => pvc.metadata?.labels?.['workspace-uid'] === uid)
-        .map((pvc) => ({
-          name: pvc.metadata?.name ?? '',
-          capacity: pvc.status?.capacity?.['storage'] ?? '',
-          status: pvc.status?.phase ?? '',
-          storage_class: pvc.spec?.storageClassName ?? '',
-        }))
+      const wsPvcs = workspacePvcs(pvcs, uid)
 
+      const statuses = new Map(
+        (pod.status?.containerStatuses ?? []).map((s) => [s.name, s]),
+      )
       const containers = (pod.spec?.containers ?? []).map((c) => {
-        const status = (pod.status?.containerStatuses ?? []).find(
-          (s) => s.name === c.name,
-        )
+        const status = statuses.get(c.name)
         return {
           name: c.name,
           image: c.image ?? '',
@@ -333,7 +374,7 @@ export const getWorkspaceDetail = createServerFn({ method: 'GET' })
 
       const ready = isPodReady(pod)
       const age = pod.metadata?.creationTimestamp
-        ? formatAge(new Date(pod.metadata.creationTimestamp))
+        ? formatAge(pod.metadata.creationTimestamp)
         : ''
 
       return {
@@ -345,7 +386,7 @@ export const getWorkspaceDetail = createServerFn({ method: 'GET' })
         pvcs: wsPvcs,
         containers,
         usage: metric ? { cpu: metric.cpu, memory: metric.memory } : null,
-        repo: annotations['wsk/repo'] ?? '',
+        ...annotationFields(annotations),
         running: ready,
         creating: hasCreationLog(uid),
         uid,
@@ -355,24 +396,11 @@ export const getWorkspaceDetail = createServerFn({ method: 'GET' })
         conditions: (pod.status?.conditions ?? []) as unknown[],
         age,
         resources,
-        branch: annotations['wsk/branch'] ?? '',
-        dirty: annotations['wsk/dirty'] === 'true',
-        last_commit: annotations['wsk/last-commit'] ?? '',
         pvc_usage: {},
-        owner: annotations['wsk/owner'] ?? '',
-        last_accessed: annotations['wsk/last-accessed'] ?? '',
-        expiry_warning: annotations['wsk/expiry-warning'] ?? '',
       }
     }
 
-    // Workspace is stopped -- look for saved spec by uid
-    const savedCms = await listConfigMaps(
-      `managed-by=workspacekit,workspace-uid=${uid}`,
-    )
-    const savedCm = savedCms.find(
-      (cm) => cm.metadata?.name?.startsWith('saved-'),
-    )
-
+    // Workspace is stopped -- fall back to its saved spec
     if (!savedCm) {
       return null
     }
@@ -396,14 +424,7 @@ export const getWorkspaceDetail = createServerFn({ method: 'GET' })
 
     // Find PVCs for this workspace
     const pvcs = await listWorkspacePvcs()
-    const wsPvcs = pvcs
-      .filter((pvc) => pvc.metadata?.labels?.['workspace-uid'] === uid)
-      .map((pvc) => ({
-        name: pvc.metadata?.name ?? '',
-        capacity: pvc.status?.capacity?.['storage'] ?? '',
-        status: pvc.status?.phase ?? '',
-        storage_class: pvc.spec?.storageClassName ?? '',
-      }))
+    const wsPvcs = workspacePvcs(pvcs, uid)
 
     return {
       name: wsName,
@@ -414,7 +435,7 @@ export const getWorkspaceDetail = createServerFn({ method: 'GET' })
       pvcs: wsPvcs,
       containers: [],
       usage: null,
-      repo: annotations['wsk/repo'] ?? '',
+      ...annotationFields(annotations),
       running: false,
       creating: false,
       uid,
@@ -424,13 +445,7 @@ export const getWorkspaceDetail = createServerFn({ method: 'GET' })
       conditions: [],
       age: '',
       resources,
-      branch: annotations['wsk/branch'] ?? '',
-      dirty: annotations['wsk/dirty'] === 'true',
-      last_commit: annotations['wsk/last-commit'] ?? '',
       pvc_usage: {},
-      owner: annotations['wsk/owner'] ?? '',
-      last_accessed: annotations['wsk/last-accessed'] ?? '',
-      expiry_warning: annotations['wsk/expiry-warning'] ?? '',
     }
   })
 
@@ -926,8 +941,15 @@ export const bulkAction = createServerFn({ method: 'POST' })
 // Internal helpers
 // ---------------------------------------------------------------------------
 
-function formatAge(date: Date): string {
-  const diffMs = Date.now() - date.getTime()
+/**
+ * Formats the time since `timestamp` as "45s" / "12m" / "3h" / "2d". The
+ * Kubernetes client already hands creation timestamps over as Dates;
+ * strings are parsed without building an intermediate Date.
+ */
+function formatAge(timestamp: Date | string): string {
+  const ms = timestamp instanceof Date ? timestamp.getTime() : Date.parse(timestamp)
+  if (Number.isNaN(ms)) return ''
+  const diffMs = Date.now() - ms
   if (diffMs < 0) return '0s'
 
   const seconds = Math.floor(diffMs / 1000)
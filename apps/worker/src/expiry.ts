@@ -23,6 +23,37 @@ const EXPIRY_WARNING_ANNOTATION = 'wsk/expiry-warning'
 
 const MS_PER_DAY = 86_400_000
 
+/** Upper bound on memoized last-accessed timestamps. */
+const PARSED_TS_CACHE_MAX = 256
+
+// ---------------------------------------------------------------------------
+// Timestamp parsing
+// ---------------------------------------------------------------------------
+
+/**
+ * Parsed last-accessed annotations keyed by their raw string. The annotation
+ * only changes when a workspace is used, so most checks hit the cache.
+ * Map insertion order doubles as LRU order.
+ */
+const parsedTsCache = new Map<string, number>()
+
+function parseTimestampMs(value: string): number {
+  const cached = parsedTsCache.get(value)
+  if (cached !== undefined) {
+    parsedTsCache.delete(value)
+    parsedTsCache.set(value, cached)
+    return cached
+  }
+
+  const ms = new Date(value).getTime()
+  parsedTsCache.set(value, ms)
+  if (parsedTsCache.size > PARSED_TS_CACHE_MAX) {
+    const oldest = parsedTsCache.keys().next().value
+    if (oldest !== undefined) parsedTsCache.delete(oldest)
+  }
+  return ms
+}
+
 // ---------------------------------------------------------------------------
 // Expiry checker
 // ---------------------------------------------------------------------------
@@ -72,7 +103,7 @@ export async function checkExpiry(): Promise<void> {
     let lastAccessedMs: number
 
     if (lastAccessedStr) {
-      lastAccessedMs = new Date(lastAccessedStr).getTime()
+      lastAccessedMs = parseTimestampMs(lastAccessedStr)
     } else {
       // Fall back to pod creation timestamp
       const creationStr = pod.metadata?.creationTimestamp
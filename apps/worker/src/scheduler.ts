@@ -59,6 +59,9 @@ export function _resetDedupMap(): void {
 // Schedule checker
 // ---------------------------------------------------------------------------
 
+/** Short weekday names indexed by Date#getUTCDay(), matching Schedule.days. */
+const UTC_DAY_NAMES = ['Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat'] as const
+
 /**
  * Checks all schedules and fires matching actions for the current UTC time.
  */
@@ -66,10 +69,7 @@ export async function checkSchedules(): Promise<void> {
   const now = Date.now()
   const utcNow = new Date(now)
 
-  const currentDay = utcNow.toLocaleString('en-US', {
-    weekday: 'short',
-    timeZone: 'UTC',
-  }) // "Mon", "Tue", ...
+  const currentDay = UTC_DAY_NAMES[utcNow.getUTCDay()]
   const currentHour = utcNow.getUTCHours()
   const currentMinute = utcNow.getUTCMinutes()
 
@@ -81,17 +81,20 @@ export async function checkSchedules(): Promise<void> {
     return
   }
 
-  if (schedules.length === 0) return
+  // Most ticks match nothing; pick out the due schedules first (cheap
+  // integer compares before the day lookup) and bail before any bookkeeping.
+  const due = schedules.filter(
+    (s) =>
+      s.hour === currentHour &&
+      s.minute === currentMinute &&
+      s.days.includes(currentDay),
+  )
+  if (due.length === 0) return
 
   // Clean stale dedup entries
   cleanFiredMap(now)
 
-  for (const schedule of schedules) {
-    // Check if this schedule matches the current time
-    if (schedule.hour !== currentHour) continue
-    if (schedule.minute !== currentMinute) continue
-    if (!schedule.days.includes(currentDay)) continue
-
+  for (const schedule of due) {
     const key = dedupKey(schedule, currentDay)
     if (wasFiredRecently(key, now)) {
       continue
@@ -66,6 +66,8 @@ const {
   getWorkspaceMeta,
   savePodSpec,
   getSavedPodSpec,
+  getSavedSpecConfigMap,
+  _resetConfigCache,
 } = await import('../src/configmaps')
 
 // ---------------------------------------------------------------------------
@@ -184,6 +186,7 @@ describe('listConfigMaps', () => {
 describe('getSchedules', () => {
   beforeEach(() => {
     mockReadNamespacedConfigMap.mockClear()
+    _resetConfigCache()
   })
 
   test('parses schedules from configmap', async () => {
@@ -224,6 +227,73 @@ describe('getSchedules', () => {
     const result = await getSchedules()
     expect(result).toEqual([])
   })
+
+  test('serves repeat reads from cache until a save invalidates it', async () => {
+    mockReadNamespacedConfigMap.mockResolvedValueOnce({
+      metadata: { name: SCHEDULES_CM },
+      data: { schedules: '[]' },
+    })
+    await getSchedules()
+    await getSchedules()
+    expect(mockReadNamespacedConfigMap).toHaveBeenCalledTimes(1)
+
+    await saveSchedules([])
+    mockReadNamespacedConfigMap.mockResolvedValueOnce({
+      metadata: { name: SCHEDULES_CM },
+      data: { schedules: '[]' },
+    })
+    await getSchedules()
+    expect(mockReadNamespacedConfigMap).toHaveBeenCalledTimes(2)
+  })
+
+  test('does not cache a read that overlaps a save', async () => {
+    const stale = [
+      { workspace: 'ws1', pod_name: 'ws-1', action: 'start', days: ['mon'], hour: 9, minute: 0 },
+    ]
+    let release: (cm: unknown) => void = () => {}
+    mockReadNamespacedConfigMap.mockImplementationOnce(
+      () => new Promise((resolve) => { release = resolve }) as never,
+    )
+    const inFlight = getSchedules()
+    await saveSchedules([])
+    release({ metadata: { name: SCHEDULES_CM }, data: { schedules: JSON.stringify(stale) } })
+    expect(await inFlight).toHaveLength(1)
+
+    mockReadNamespacedConfigMap.mockResolvedValueOnce({
+      metadata: { name: SCHEDULES_CM },
+      data: { schedules: '[]' },
+    })
+    expect(await getSchedules()).toEqual([])
+    expect(mockReadNamespacedConfigMap).toHaveBeenCalledTimes(2)
+  })
+
+  test('returns frozen schedules so callers cannot mutate the cache', async () => {
+    const schedules = [
+      { workspace: 'ws1', pod_name: 'ws-1', action: 'start', days: ['mon'], hour: 9, minute: 0 },
+    ]
+    mockReadNamespacedConfigMap.mockResolvedValueOnce({
+      metadata: { name: SCHEDULES_CM },
+      data: { schedules: JSON.stringify(schedules) },
+    })
+    const result = await getSchedules()
+    expect(Object.isFrozen(result)).toBe(true)
+    expect(() => result.push(result[0])).toThrow(TypeError)
+    expect(() => {
+      result[0].hour = 10
+    }).toThrow(TypeError)
+    expect((await getSchedules())[0].hour).toBe(9)
+  })
+
+  test('a save in another namespace leaves the cached read alone', async () => {
+    mockReadNamespacedConfigMap.mockResolvedValueOnce({
+      metadata: { name: SCHEDULES_CM },
+      data: { schedules: '[]' },
+    })
+    await getSchedules()
+    await upsertConfigMap(SCHEDULES_CM, 'other-ns', { schedules: '[]' })
+    await getSchedules()
+    expect(mockReadNamespacedConfigMap).toHaveBeenCalledTimes(1)
+  })
 })
 
 describe('saveSchedules', () => {
@@ -243,6 +313,7 @@ describe('saveSchedules', () => {
 describe('getExpiryDays', () => {
   beforeEach(() => {
     mockReadNamespacedConfigMap.mockClear()
+    _resetConfigCache()
   })
 
   test('returns expiry days from configmap', async () => {
@@ -341,6 +412,7 @@ describe('savePresets', () => {
 describe('getWorkspaceDefaults', () => {
   beforeEach(() => {
     mockReadNamespacedConfigMap.mockClear()
+    _resetConfigCache()
   })
 
   test('returns defaults from configmap', async () => {
@@ -362,6 +434,25 @@ describe('getWorkspaceDefaults', () => {
     expect(defaults.lim_cpu).toBe('')
     expect(defaults.lim_mem).toBe('')
   })
+
+  test('re-reads after saveWorkspaceDefaults', async () => {
+    mockReadNamespacedConfigMap.mockResolvedValueOnce({
+      metadata: { name: DEFAULTS_CM },
+      data: { req_cpu: '250m', req_mem: '512Mi', lim_cpu: '1', lim_mem: '2Gi' },
+    })
+    await getWorkspaceDefaults()
+    await getWorkspaceDefaults()
+    expect(mockReadNamespacedConfigMap).toHaveBeenCalledTimes(1)
+
+    await saveWorkspaceDefaults({ req_cpu: '500m', req_mem: '1Gi', lim_cpu: '2', lim_mem: '4Gi' })
+    mockReadNamespacedConfigMap.mockResolvedValueOnce({
+      metadata: { name: DEFAULTS_CM },
+      data: { req_cpu: '500m', req_mem: '1Gi', lim_cpu: '2', lim_mem: '4Gi' },
+    })
+    const defaults = await getWorkspaceDefaults()
+    expect(defaults.req_cpu).toBe('500m')
+    expect(mockReadNamespacedConfigMap).toHaveBeenCalledTimes(2)
+  })
 })
 
 describe('saveWorkspaceDefaults', () => {
@@ -495,3 +586,52 @@ describe('getSavedPodSpec', () => {
     expect(result).toBeNull()
   })
 })
+
+describe('getSavedSpecConfigMap', () => {
+  beforeEach(() => {
+    mockReadNamespacedConfigMap.mockClear()
+    _resetConfigCache()
+  })
+
+  test('reads through, so a delete by another process is seen at once', async () => {
+    mockReadNamespacedConfigMap.mockResolvedValueOnce({
+      metadata: { name: 'saved-abc123' },
+      data: { spec: '{}' },
+    })
+    const first = await getSavedSpecConfigMap('abc123')
+    expect(first?.metadata?.name).toBe('saved-abc123')
+
+    // Deleted by the worker: no deleteConfigMap call in this process.
+    mockReadNamespacedConfigMap.mockRejectedValueOnce({ code: 404 })
+    expect(await getSavedSpecConfigMap('abc123')).toBeNull()
+    expect(mockReadNamespacedConfigMap).toHaveBeenCalledTimes(2)
+  })
+
+  test('re-reads after the spec is deleted', async () => {
+    mockReadNamespacedConfigMap.mockResolvedValueOnce({
+      metadata: { name: 'saved-abc123' },
+      data: { spec: '{}' },
+    })
+    await getSavedSpecConfigMap('abc123')
+    await deleteConfigMap('saved-abc123')
+
+    mockReadNamespacedConfigMap.mockRejectedValueOnce({ code: 404 })
+    expect(await getSavedSpecConfigMap('abc123')).toBeNull()
+    expect(mockReadNamespacedConfigMap).toHaveBeenCalledTimes(2)
+  })
+
+  test('does not cache a spec read that overlaps its deletion', async () => {
+    let release: (cm: unknown) => void = () => {}
+    mockReadNamespacedConfigMap.mockImplementationOnce(
+      () => new Promise((resolve) => { release = resolve }) as never,
+    )
+    const inFlight = getSavedSpecConfigMap('abc123')
+    const deleting = deleteConfigMap('saved-abc123')
+    release({ metadata: { name: 'saved-abc123' }, data: { spec: '{}' } })
+    await Promise.all([inFlight, deleting])
+
+    mockReadNamespacedConfigMap.mockRejectedValueOnce({ code: 404 })
+    expect(await getSavedSpecConfigMap('abc123')).toBeNull()
+    expect(mockReadNamespacedConfigMap).toHaveBeenCalledTimes(2)
+  })
+})
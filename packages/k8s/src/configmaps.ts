@@ -11,6 +11,80 @@ export const EXPIRY_CM = 'workspacekit-expiry'
 export const TEMPLATES_CM = 'workspacekit-templates'
 export const DEFAULTS_CM = 'workspacekit-defaults'
 
+// ---------------------------------------------------------------------------
+// Short-lived read cache
+// ---------------------------------------------------------------------------
+
+/** How long schedule / expiry / defaults reads are served from memory (milliseconds). */
+const CONFIG_CACHE_TTL_MS = 5_000
+
+/**
+ * Parsed settings keyed by namespace and configmap name. The dashboard polls
+ * these far more often than they change; once a write through
+ * upsertConfigMap / deleteConfigMap settles, this process sees its result.
+ *
+ * The cache is per process. Writes made elsewhere -- schedule and expiry
+ * saves from the web server as seen by the worker, or the worker's expiry
+ * deletes as seen by the web server -- are only picked up when the entry
+ * expires, so readers can lag them by up to CONFIG_CACHE_TTL_MS.
+ *
+ * Every caller of a key shares one value, so values are deep-frozen before
+ * they are returned: a caller that mutates one throws instead of silently
+ * changing what later reads see.
+ */
+const configCache = new Map<string, { value: unknown; expires: number }>()
+
+/**
+ * Bumped each time a write to a key settles. A read that was already in
+ * flight when the write landed may have fetched the old configmap, so it is
+ * returned to its caller but not cached.
+ */
+const configGenerations = new Map<string, number>()
+
+function cacheKey(ns: string, name: string): string {
+  return `${ns}/${name}`
+}
+
+function deepFreeze<T>(value: T): T {
+  if (value !== null && typeof value === 'object' && !Object.isFrozen(value)) {
+    Object.freeze(value)
+    for (const child of Object.values(value)) deepFreeze(child)
+  }
+  return value
+}
+
+async function cachedRead<T>(name: string, load: () => Promise<T>): Promise<T> {
+  const key = cacheKey(namespace, name)
+  const hit = configCache.get(key)
+  if (hit && hit.expires > Date.now()) return hit.value as T
+  const generation = configGenerations.get(key) ?? 0
+  const value = deepFreeze(await load())
+  if ((configGenerations.get(key) ?? 0) === generation) {
+    configCache.set(key, { value, expires: Date.now() + CONFIG_CACHE_TTL_MS })
+  }
+  return value
+}
+
+/**
+ * Runs a configmap write, then invalidates its cache entry -- whether or not
+ * the write succeeded, since a failed request may still have been applied.
+ */
+async function writeThrough<T>(ns: string, name: string, write: () => Promise<T>): Promise<T> {
+  const key = cacheKey(ns, name)
+  try {
+    return await write()
+  } finally {
+    configGenerations.set(key, (configGenerations.get(key) ?? 0) + 1)
+    configCache.delete(key)
+  }
+}
+
+/** Exposed for testing: drops all cached configmap reads. */
+export function _resetConfigCache(): void {
+  configCache.clear()
+  configGenerations.clear()
+}
+
 // ---------------------------------------------------------------------------
 // Generic ConfigMap CRUD
 // ---------------------------------------------------------------------------
@@ -49,35 +123,39 @@ export async function upsertConfigMap(
     data,
   }
 
-  try {
-    return await coreV1.createNamespacedConfigMap({
-      namespace: ns,
-      body: cm,
-    })
-  } catch (err: unknown) {
-    if (isHttpError(err) && err.code === 409) {
-      return await coreV1.replaceNamespacedConfigMap({
-        name,
+  return writeThrough(ns, name, async () => {
+    try {
+      return await coreV1.createNamespacedConfigMap({
         namespace: ns,
         body: cm,
       })
+    } catch (err: unknown) {
+      if (isHttpError(err) && err.code === 409) {
+        return await coreV1.replaceNamespacedConfigMap({
+          name,
+          namespace: ns,
+          body: cm,
+        })
+      }
+      throw err
     }
-    throw err
-  }
+  })
 }
 
 /**
  * Deletes a configmap by name. Ignores 404 (already deleted).
  */
 export async function deleteConfigMap(name: string): Promise<void> {
-  try {
-    await coreV1.deleteNamespacedConfigMap({ name, namespace })
-  } catch (err: unknown) {
-    if (isHttpError(err) && err.code === 404) {
-      return
+  await writeThrough(namespace, name, async () => {
+    try {
+      await coreV1.deleteNamespacedConfigMap({ name, namespace })
+    } catch (err: unknown) {
+      if (isHttpError(err) && err.code === 404) {
+        return
+      }
+      throw err
     }
-    throw err
-  }
+  })
 }
 
 /**
@@ -96,18 +174,20 @@ export async function listConfigMaps(labelSelector: string): Promise<k8s.V1Confi
 // ---------------------------------------------------------------------------
 
 /**
- * Reads schedules from the schedules configmap.
+ * Reads schedules from the schedules configmap (cached for a few seconds).
  */
 export async function getSchedules(): Promise<Schedule[]> {
-  const cm = await getConfigMap(SCHEDULES_CM)
-  if (!cm?.data?.schedules) {
-    return []
-  }
-  try {
-    return JSON.parse(cm.data.schedules) as Schedule[]
-  } catch {
-    return []
-  }
+  return cachedRead(SCHEDULES_CM, async () => {
+    const cm = await getConfigMap(SCHEDULES_CM)
+    if (!cm?.data?.schedules) {
+      return []
+    }
+    try {
+      return JSON.parse(cm.data.schedules) as Schedule[]
+    } catch {
+      return []
+    }
+  })
 }
 
 /**
@@ -125,14 +205,17 @@ export async function saveSchedules(schedules: Schedule[]): Promise<void> {
 
 /**
  * Reads the expiry days setting. Returns 0 if not set (disabled).
+ * Cached for a few seconds like getSchedules.
  */
 export async function getExpiryDays(): Promise<number> {
-  const cm = await getConfigMap(EXPIRY_CM)
-  if (!cm?.data?.days) {
-    return 0
-  }
-  const parsed = parseInt(cm.data.days, 10)
-  return isNaN(parsed) ? 0 : parsed
+  return cachedRead(EXPIRY_CM, async () => {
+    const cm = await getConfigMap(EXPIRY_CM)
+    if (!cm?.data?.days) {
+      return 0
+    }
+    const parsed = parseInt(cm.data.days, 10)
+    return isNaN(parsed) ? 0 : parsed
+  })
 }
 
 /**
@@ -180,13 +263,15 @@ export async function savePresets(presets: Preset[]): Promise<void> {
  * Reads workspace resource defaults.
  */
 export async function getWorkspaceDefaults(): Promise<WorkspaceDefaults> {
-  const cm = await getConfigMap(DEFAULTS_CM)
-  return {
-    req_cpu: cm?.data?.req_cpu ?? '',
-    req_mem: cm?.data?.req_mem ?? '',
-    lim_cpu: cm?.data?.lim_cpu ?? '',
-    lim_mem: cm?.data?.lim_mem ?? '',
-  }
+  return cachedRead(DEFAULTS_CM, async () => {
+    const cm = await getConfigMap(DEFAULTS_CM)
+    return {
+      req_cpu: cm?.data?.req_cpu ?? '',
+      req_mem: cm?.data?.req_mem ?? '',
+      lim_cpu: cm?.data?.lim_cpu ?? '',
+      lim_mem: cm?.data?.lim_mem ?? '',
+    }
+  })
 }
 
 /**
@@ -298,6 +383,19 @@ export async function savePodSpec(
   )
 }
 
+/**
+ * Gets the `saved-{uid}` configmap, or null if the workspace has none. This
+ * is a single point read by name rather than a list of every saved spec.
+ *
+ * It is deliberately not cached. The workspace detail page calls it on every
+ * load, for running workspaces too, and the configmap is also written by the
+ * worker, whose expiry deletes and scheduled stops would otherwise go unseen
+ * here for up to CONFIG_CACHE_TTL_MS and show a deleted workspace as stopped.
+ */
+export async function getSavedSpecConfigMap(uid: string): Promise<k8s.V1ConfigMap | null> {
+  return getConfigMap(`saved-${uid}`)
+}
+
 /**
  * Gets a saved pod spec. Returns the parsed V1Pod or null.
  */
@@ -12,10 +12,16 @@ export async function getPodEvents(podName: string): Promise<Event[]> {
       fieldSelector: `involvedObject.name=${podName}`,
     })
 
+    // One clock read per listing: every row is aged against the same instant.
+    const nowMs = Date.now()
+
     return response.items.map((event) => ({
       type: event.type ?? 'Normal',
       reason: event.reason ?? '',
-      age: formatAge(event.lastTimestamp ?? event.eventTime ?? event.metadata?.creationTimestamp),
+      age: formatAge(
+        event.lastTimestamp ?? event.eventTime ?? event.metadata?.creationTimestamp,
+        nowMs,
+      ),
       message: event.message ?? '',
     }))
   } catch {
@@ -28,14 +34,17 @@ export async function getPodEvents(podName: string): Promise<Event[]> {
 // ---------------------------------------------------------------------------
 
 /**
- * Formats a timestamp into a human-readable relative age string.
+ * Formats a timestamp into a human-readable relative age string, measured
+ * against `nowMs`.
  */
-function formatAge(timestamp: Date | string | undefined | null): string {
+function formatAge(
+  timestamp: Date | string | undefined | null,
+  nowMs: number,
+): string {
   if (!timestamp) return ''
 
   const date = timestamp instanceof Date ? timestamp : new Date(timestamp)
-  const now = new Date()
-  const diffMs = now.getTime() - date.getTime()
+  const diffMs = nowMs - date.getTime()
 
   if (diffMs < 0) return '0s'
 
@@ -62,6 +62,7 @@ export {
   migrateMetaConfigMaps,
   savePodSpec,
   getSavedPodSpec,
+  getSavedSpecConfigMap,
 } from './configmaps.js'
 
 // Resources (LimitRange, ResourceQuota)
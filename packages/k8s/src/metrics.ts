@@ -65,6 +65,27 @@ export function parseCpuValue(s: string): number {
   return isNaN(val) ? 0 : Math.round(val * 1000)
 }
 
+const MIB = 1024 ** 2
+
+/**
+ * Memory quantity suffixes and their multipliers. Binary suffixes (two-char)
+ * come first so "Mi" is matched before "M".
+ */
+const MEM_UNITS: ReadonlyArray<readonly [string, number]> = [
+  ['Ki', 1024],
+  ['Mi', 1024 ** 2],
+  ['Gi', 1024 ** 3],
+  ['Ti', 1024 ** 4],
+  ['Pi', 1024 ** 5],
+  ['Ei', 1024 ** 6],
+  ['k', 1000],
+  ['M', 1000 ** 2],
+  ['G', 1000 ** 3],
+  ['T', 1000 ** 4],
+  ['P', 1000 ** 5],
+  ['E', 1000 ** 6],
+]
+
 /**
  * Parses a memory value string into bytes.
  * "512Mi" -> 536870912, "1Gi" -> 1073741824, "128974848" -> 128974848
@@ -73,23 +94,7 @@ export function parseMemValue(s: string): number {
   if (!s) return 0
   const str = s.trim()
 
-  const units: Record<string, number> = {
-    Ki: 1024,
-    Mi: 1024 ** 2,
-    Gi: 1024 ** 3,
-    Ti: 1024 ** 4,
-    Pi: 1024 ** 5,
-    Ei: 1024 ** 6,
-    k: 1000,
-    M: 1000 ** 2,
-    G: 1000 ** 3,
-    T: 1000 ** 4,
-    P: 1000 ** 5,
-    E: 1000 ** 6,
-  }
-
-  // Check binary suffixes first (two-char), then SI suffixes (one-char)
-  for (const [suffix, multiplier] of Object.entries(units)) {
+  for (const [suffix, multiplier] of MEM_UNITS) {
     if (str.endsWith(suffix)) {
       const numStr = str.slice(0, -suffix.length)
       const val = parseFloat(numStr)
@@ -110,10 +115,9 @@ export function parseMemValue(s: string): number {
  * Formats bytes into a human-readable memory string with Mi suffix.
  */
 function formatMemory(bytes: number): string {
-  const mi = bytes / (1024 * 1024)
+  const mi = bytes / MIB
   if (mi >= 1024) {
-    const gi = mi / 1024
-    return `${gi.toFixed(1)}Gi`
+    return `${(mi / 1024).toFixed(1)}Gi`
   }
   return `${Math.round(mi)}Mi`
 }
@@ -9,12 +9,16 @@ const MANAGED_BY_LABEL = 'managed-by=workspacekit'
 // Shell escape helper (Fix 1)
 // ---------------------------------------------------------------------------
 
+const SINGLE_QUOTE_RE = /'/g
+
 /**
  * Escapes a string for safe use in a POSIX shell single-quoted context.
- * Wraps in single quotes with internal quote escaping.
+ * Wraps in single quotes with internal quote escaping. Values without a
+ * quote (the common case for feature refs and options) skip the regex pass.
  */
 function shellEscape(str: string): string {
-  return "'" + str.replace(/'/g, "'\\''") + "'"
+  if (!str.includes("'")) return "'" + str + "'"
+  return "'" + str.replace(SINGLE_QUOTE_RE, "'\\''") + "'"
 }
 
 /**
@@ -287,7 +291,7 @@ function buildStartupScript(opts: {
   }
 
   lines.push('echo "@@STEP:starting:in-progress"')
-  lines.push(`exec ${opts.openvscodePath}/bin/openvscode-server --host 0.0.0.0 --port 10800 --connection-token ${opts.uid}`)
+  lines.push(`exec ${shellEscape(`${opts.openvscodePath}/bin/openvscode-server`)} --host 0.0.0.0 --port 10800 --connection-token ${shellEscape(opts.uid)}`)
 
   return lines.join('\n')
 }
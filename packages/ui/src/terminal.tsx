@@ -1,11 +1,11 @@
 import { useEffect, useRef, useState } from 'react'
 import { theme } from './theme'
 
-// xterm.js imports -- these resolve at runtime from the dependencies declared
-// in package.json.  Type-only fallbacks keep the compiler happy even when the
-// packages are not installed in the current workspace.
-import { Terminal as XTerm } from '@xterm/xterm'
-import { FitAddon } from '@xterm/addon-fit'
+// xterm.js is only needed once a terminal is actually opened, so the runtime
+// modules are loaded on demand (see loadXterm); these imports are types only
+// and do not pull the library into the page bundle.
+import type { Terminal as XTerm } from '@xterm/xterm'
+import type { FitAddon } from '@xterm/addon-fit'
 
 export interface TerminalProps {
   /** Kubernetes pod name (displayed in the header). */
@@ -16,6 +16,71 @@ export interface TerminalProps {
 
 type ConnectionState = 'connecting' | 'connected' | 'disconnected'
 
+/** Shared encoder for text frames; it is stateless, so one instance serves all terminals. */
+const textEncoder = new TextEncoder()
+
+/**
+ * Queued output is written immediately once it reaches this size. Animation
+ * frames do not run in background tabs, so without a cap a noisy build left
+ * running there would queue its entire output until the tab is shown.
+ */
+const MAX_PENDING_OUTPUT_BYTES = 1024 * 1024
+
+/**
+ * xterm palette and connection-state colours, resolved from the theme tokens
+ * once at module load rather than rebuilt on every mount / render.
+ */
+const XTERM_THEME = {
+  background: theme.colors.codeBg,
+  foreground: theme.colors.text,
+  cursor: theme.colors.primary,
+  selectionBackground: `${theme.colors.primary}40`,
+  black: '#484f58',
+  red: theme.colors.danger,
+  green: theme.colors.success,
+  yellow: theme.colors.warning,
+  blue: theme.colors.primary,
+  magenta: '#bc8cff',
+  cyan: '#76e3ea',
+  white: theme.colors.text,
+  brightBlack: '#6e7681',
+  brightRed: '#ffa198',
+  brightGreen: '#56d364',
+  brightYellow: '#e3b341',
+  brightBlue: '#79c0ff',
+  brightMagenta: '#d2a8ff',
+  brightCyan: '#b3f0ff',
+  brightWhite: '#f0f6fc',
+}
+
+const STATE_COLORS: Record<ConnectionState, string> = {
+  connecting: theme.colors.warning,
+  connected: theme.colors.success,
+  disconnected: theme.colors.danger,
+}
+
+type XtermModules = [typeof import('@xterm/xterm'), typeof import('@xterm/addon-fit')]
+
+let xtermModules: Promise<XtermModules> | null = null
+
+/**
+ * Loads xterm and the fit addon as a separate chunk on first use. The
+ * promise is cached so later terminals reuse it; a failed load is forgotten
+ * so the next attempt retries.
+ */
+function loadXterm(): Promise<XtermModules> {
+  if (!xtermModules) {
+    xtermModules = Promise.all([
+      import('@xterm/xterm'),
+      import('@xterm/addon-fit'),
+    ]).catch((err) => {
+      xtermModules = null
+      throw err
+    })
+  }
+  return xtermModules
+}
+
 // ---------------------------------------------------------------------------
 // Component
 // ---------------------------------------------------------------------------
@@ -32,134 +97,184 @@ export const Terminal: React.FC<TerminalProps> = ({ podName, wsUrl }) => {
     const container = containerRef.current
     if (!container) return
 
-    // ---- xterm setup ----
-    const term = new XTerm({
-      cursorBlink: true,
-      fontSize: 14,
-      fontFamily: "'SFMono-Regular', Consolas, 'Liberation Mono', Menlo, monospace",
-      theme: {
-        background: theme.colors.codeBg,
-        foreground: theme.colors.text,
-        cursor: theme.colors.primary,
-        selectionBackground: `${theme.colors.primary}40`,
-        black: '#484f58',
-        red: theme.colors.danger,
-        green: theme.colors.success,
-        yellow: theme.colors.warning,
-        blue: theme.colors.primary,
-        magenta: '#bc8cff',
-        cyan: '#76e3ea',
-        white: theme.colors.text,
-        brightBlack: '#6e7681',
-        brightRed: '#ffa198',
-        brightGreen: '#56d364',
-        brightYellow: '#e3b341',
-        brightBlue: '#79c0ff',
-        brightMagenta: '#d2a8ff',
-        brightCyan: '#b3f0ff',
-        brightWhite: '#f0f6fc',
-      },
-    })
+    let cancelled = false
+    let teardown: (() => void) | null = null
+
+    setConnState('connecting')
+
+    const setup = ([xterm, fitAddon]: XtermModules) => {
+      if (cancelled) return
 
-    const fit = new FitAddon()
-    term.loadAddon(fit)
-    term.open(container)
+      // ---- xterm setup ----
+      const term = new xterm.Terminal({
+        cursorBlink: true,
+        fontSize: 14,
+        fontFamily: "'SFMono-Regular', Consolas, 'Liberation Mono', Menlo, monospace",
+        theme: XTERM_THEME,
+      })
 
-    // Small delay so the container dimensions are settled before fitting.
-    requestAnimationFrame(() => {
+      // A failure part-way through (a malformed wsUrl, term.open throwing)
+      // must not leave a half-built terminal or an open socket behind.
       try {
-        fit.fit()
-      } catch {
-        // Container might not be visible yet; ignore.
-      }
-    })
+        const fit = new fitAddon.FitAddon()
+        term.loadAddon(fit)
+        term.open(container)
 
-    termRef.current = term
-    fitRef.current = fit
+        // Small delay so the container dimensions are settled before fitting.
+        requestAnimationFrame(() => {
+          try {
+            fit.fit()
+          } catch {
+            // Container might not be visible yet; ignore.
+          }
+        })
 
-    // ---- WebSocket setup ----
-    setConnState('connecting')
-    const ws = new WebSocket(wsUrl)
-    wsRef.current = ws
+        termRef.current = term
+        fitRef.current = fit
 
-    ws.binaryType = 'arraybuffer'
+        // ---- WebSocket setup ----
+        const ws = new WebSocket(wsUrl)
+        wsRef.current = ws
 
-    ws.addEventListener('open', () => {
-      setConnState('connected')
-      term.focus()
+        ws.binaryType = 'arraybuffer'
 
-      // Send initial terminal dimensions so the server can set pty size.
-      const dimensions = { type: 'resize', cols: term.cols, rows: term.rows }
-      ws.send(JSON.stringify(dimensions))
-    })
+        ws.addEventListener('open', () => {
+          setConnState('connected')
+          term.focus()
 
-    ws.addEventListener('message', (event) => {
-      if (typeof event.data === 'string') {
-        term.write(event.data)
-      } else if (event.data instanceof ArrayBuffer) {
-        term.write(new Uint8Array(event.data))
-      }
-    })
+          // Send initial terminal dimensions so the server can set pty size.
+          const dimensions = { type: 'resize', cols: term.cols, rows: term.rows }
+          ws.send(JSON.stringify(dimensions))
+        })
 
-    ws.addEventListener('close', () => {
-      setConnState('disconnected')
-      term.write('\r\n\x1b[90m--- connection closed ---\x1b[0m\r\n')
-    })
+        // Output is queued and written once per animation frame, so a burst of
+        // small packets costs one xterm parse instead of one per packet.
+        let pending: Uint8Array[] = []
+        let pendingBytes = 0
+        let flushFrame: number | null = null
 
-    ws.addEventListener('error', () => {
-      setConnState('disconnected')
-    })
+        const flushOutput = () => {
+          flushFrame = null
+          if (pending.length === 1) {
+            term.write(pending[0])
+          } else {
+            const merged = new Uint8Array(pendingBytes)
+            let offset = 0
+            for (const chunk of pending) {
+              merged.set(chunk, offset)
+              offset += chunk.length
+            }
+            term.write(merged)
+          }
+          pending = []
+          pendingBytes = 0
+        }
 
-    // Pipe user input to the WebSocket.
-    const dataDisposable = term.onData((data) => {
-      if (ws.readyState === WebSocket.OPEN) {
-        ws.send(data)
-      }
-    })
+        const cancelFlush = () => {
+          if (flushFrame !== null) {
+            cancelAnimationFrame(flushFrame)
+            flushFrame = null
+          }
+        }
 
-    // Handle terminal resize -- notify the server.
-    const resizeDisposable = term.onResize(({ cols, rows }) => {
-      if (ws.readyState === WebSocket.OPEN) {
-        ws.send(JSON.stringify({ type: 'resize', cols, rows }))
-      }
-    })
+        ws.addEventListener('message', (event) => {
+          let chunk: Uint8Array
+          if (typeof event.data === 'string') {
+            chunk = textEncoder.encode(event.data)
+          } else if (event.data instanceof ArrayBuffer) {
+            chunk = new Uint8Array(event.data)
+          } else {
+            return
+          }
+          pending.push(chunk)
+          pendingBytes += chunk.length
+          if (pendingBytes >= MAX_PENDING_OUTPUT_BYTES) {
+            cancelFlush()
+            flushOutput()
+          } else if (flushFrame === null) {
+            flushFrame = requestAnimationFrame(flushOutput)
+          }
+        })
 
-    // Refit when the browser window changes size.
-    const handleWindowResize = () => {
-      try {
-        fit.fit()
-      } catch {
-        // ignore
-      }
-    }
-    window.addEventListener('resize', handleWindowResize)
+        ws.addEventListener('close', () => {
+          setConnState('disconnected')
+          // Write any queued output before the closing banner.
+          if (flushFrame !== null) {
+            cancelFlush()
+            flushOutput()
+          }
+          term.write('\r\n\x1b[90m--- connection closed ---\x1b[0m\r\n')
+        })
 
-    // ---- Cleanup ----
-    return () => {
-      window.removeEventListener('resize', handleWindowResize)
-      dataDisposable.dispose()
-      resizeDisposable.dispose()
+        ws.addEventListener('error', () => {
+          setConnState('disconnected')
+        })
 
-      if (ws.readyState === WebSocket.OPEN || ws.readyState === WebSocket.CONNECTING) {
-        ws.close()
+        // Pipe user input to the WebSocket.
+        const dataDisposable = term.onData((data) => {
+          if (ws.readyState === WebSocket.OPEN) {
+            ws.send(data)
+          }
+        })
+
+        // Handle terminal resize -- notify the server.
+        const resizeDisposable = term.onResize(({ cols, rows }) => {
+          if (ws.readyState === WebSocket.OPEN) {
+            ws.send(JSON.stringify({ type: 'resize', cols, rows }))
+          }
+        })
+
+        // Refit when the browser window changes size.
+        const handleWindowResize = () => {
+          try {
+            fit.fit()
+          } catch {
+            // ignore
+          }
+        }
+        window.addEventListener('resize', handleWindowResize)
+
+        // ---- Cleanup ----
+        teardown = () => {
+          window.removeEventListener('resize', handleWindowResize)
+          dataDisposable.dispose()
+          resizeDisposable.dispose()
+          cancelFlush()
+
+          if (ws.readyState === WebSocket.OPEN || ws.readyState === WebSocket.CONNECTING) {
+            ws.close()
+          }
+
+          term.dispose()
+
+          termRef.current = null
+          fitRef.current = null
+          wsRef.current = null
+        }
+      } catch (err) {
+        console.error('[terminal] Setup failed:', err)
+        wsRef.current?.close()
+        term.dispose()
+        termRef.current = null
+        fitRef.current = null
+        wsRef.current = null
+        setConnState('disconnected')
       }
+    }
 
-      term.dispose()
+    // Only a failed import lands here; setup handles its own errors.
+    loadXterm().then(setup, () => {
+      if (!cancelled) setConnState('disconnected')
+    })
 
-      termRef.current = null
-      fitRef.current = null
-      wsRef.current = null
+    return () => {
+      cancelled = true
+      teardown?.()
     }
   }, [wsUrl]) // Re-run only when the WebSocket URL changes.
 
   // ---- Render ----
 
-  const stateColors: Record<ConnectionState, string> = {
-    connecting: theme.colors.warning,
-    connected: theme.colors.success,
-    disconnected: theme.colors.danger,
-  }
-
   return (
     <div
       style={{
@@ -188,7 +303,7 @@ export const Terminal: React.FC<TerminalProps> = ({ podName, wsUrl }) => {
             width: 8,
             height: 8,
             borderRadius: '50%',
-            background: stateColors[connState],
+            background: STATE_COLORS[connState],
             flexShrink: 0,
           }}
         />
@@ -198,7 +313,7 @@ export const Terminal: React.FC<TerminalProps> = ({ podName, wsUrl }) => {
         <span
           style={{
             marginLeft: 'auto',
-            color: stateColors[connState],
+            color: STATE_COLORS[connState],
             fontWeight: 500,
             textTransform: 'capitalize',
           }}